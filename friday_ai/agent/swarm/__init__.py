@@ -1,6 +1,8 @@
 """Agent Orchestration - Swarm mode and hierarchical agents."""
 
 import asyncio
+import heapq
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List, Any, Dict
@@ -20,7 +22,7 @@ class AgentRole(Enum):
     COORDINATOR = "coordinator"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task to be executed by an agent."""
 
@@ -50,8 +52,8 @@ class SwarmCoordinator:
         self.max_agents = max_agents
         self.tasks: dict[str, Task] = {}
         self.agents: dict[str, Any] = {}  # Agent instances
-        self.task_queue: asyncio.Queue = asyncio.Queue()
         self.results: dict[str, Any] = {}
+        self._sem = asyncio.Semaphore(max_agents)
 
     def add_task(self, task: Task) -> None:
         """Add a task to the swarm.
@@ -65,73 +67,89 @@ class SwarmCoordinator:
     async def run_swarm(self) -> dict:
         """Execute all tasks in parallel.
 
+        Tasks are released in topological order as their dependencies finish;
+        at most ``max_agents`` execute at once.
+
         Returns:
             Dictionary of task results.
         """
-        # Add all tasks to queue
+        # Kahn's algorithm: count unfinished dependencies per task and index
+        # dependents so each completion only touches its own out-edges.
+        in_degree: dict[str, int] = {}
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in self.tasks}
         for task_id, task in self.tasks.items():
-            await self.task_queue.put(task)
+            in_degree[task_id] = 0
+            for dep_id in task.dependencies:
+                if dep_id in dependents:
+                    dependents[dep_id].append(task_id)
+                    in_degree[task_id] += 1
+                elif dep_id not in self.results:
+                    logger.warning(f"Task {task_id} depends on unknown task: {dep_id}")
 
-        # Create worker tasks
-        workers = []
-        for i in range(min(self.max_agents, len(self.tasks))):
-            worker = asyncio.create_task(self._worker(i))
-            workers.append(worker)
+        ready = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
 
-        # Wait for all workers to complete
-        await self.task_queue.join()
-        for worker in workers:
-            worker.cancel()
+        async with asyncio.TaskGroup() as tg:
 
-        return self.results
+            async def run(task: Task) -> None:
+                async with self._sem:
+                    logger.info(f"Processing task: {task.id}")
+                    result = await self._execute_task(task)
 
-    async def _worker(self, worker_id: int) -> None:
-        """Worker task that processes the queue.
+                self._record_result(task, result)
+                for dependent_id in dependents[task.id]:
+                    in_degree[dependent_id] -= 1
+                    if in_degree[dependent_id] == 0:
+                        ready.append(dependent_id)
+                release()
 
-        Args:
-            worker_id: ID of this worker.
-        """
-        while True:
-            try:
-                task = await self.task_queue.get()
-                logger.info(f"Worker {worker_id} processing task: {task.id}")
+            def release() -> None:
+                while ready:
+                    tg.create_task(run(self.tasks[ready.popleft()]))
+
+            release()
 
-                # Check dependencies
-                if task.dependencies:
-                    await self._wait_for_dependencies(task.dependencies)
+        blocked = [task_id for task_id, degree in in_degree.items() if degree > 0]
+        if blocked:
+            logger.warning(f"Tasks not run due to a dependency cycle: {blocked}")
 
-                # Execute task
-                result = await self._execute_task(task)
+        return self.results
 
-                self.results[task.id] = result
-                task.status = "completed"
-                task.result = result
+    def _record_result(self, task: Task, result: Any) -> None:
+        """Store a finished task's result.
 
-                # FIX-009: Limit results dictionary size to prevent unbounded growth
-                if len(self.results) > self.MAX_RESULTS_SIZE:
-                    # Remove oldest 20% of results
-                    keys_to_remove = list(self.results.keys())[:self.MAX_RESULTS_SIZE // 5]
-                    for key in keys_to_remove:
-                        del self.results[key]
+        Args:
+            task: Task that finished.
+            result: Its result.
+        """
+        self.results[task.id] = result
+        task.status = "completed"
+        task.result = result
 
-                logger.info(f"Worker {worker_id} completed task: {task.id}")
-                self.task_queue.task_done()
+        # FIX-009: Limit results dictionary size to prevent unbounded growth
+        if len(self.results) > self.MAX_RESULTS_SIZE:
+            # Remove oldest 20% of results
+            keys_to_remove = list(self.results.keys())[:self.MAX_RESULTS_SIZE // 5]
+            for key in keys_to_remove:
+                del self.results[key]
 
-            except asyncio.CancelledError:
-                break
+        logger.info(f"Completed task: {task.id}")
 
-    async def _wait_for_dependencies(self, dependencies: list[str]) -> None:
-        """Wait for dependent tasks to complete.
+    async def _execute_task(self, task: Task) -> Any:
+        """Execute a task using role-based agent delegation.
 
         Args:
-            dependencies: List of task IDs to wait for.
+            task: Task to execute.
+
+        Returns:
+            Task result.
         """
-        for dep_id in dependencies:
-            while dep_id not in self.results:
-                await asyncio.sleep(0.1)
+        return self._execute_sync(task)
 
-    async def _execute_task(self, task: Task) -> Any:
-        """Execute a task using role-based agent delegation.
+    def _execute_sync(self, task: Task) -> Any:
+        """Run a task's role handler and wrap its output.
+
+        The role handlers only build strings, so they are plain functions
+        called inline rather than coroutines awaited one by one.
 
         Args:
             task: Task to execute.
@@ -159,7 +177,7 @@ class SwarmCoordinator:
             }
 
         try:
-            result = await handler(task)
+            result = handler(task)
             return {
                 "status": "completed",
                 "task": task.id,
@@ -174,7 +192,7 @@ class SwarmCoordinator:
                 "error": str(e)
             }
 
-    async def _execute_architect_task(self, task: Task) -> str:
+    def _execute_architect_task(self, task: Task) -> str:
         """Execute architect-level task.
 
         Args:
@@ -187,7 +205,7 @@ class SwarmCoordinator:
         logger.info(f"Executing architect task: {task.description}")
         return f"Architectural design for: {task.description}"
 
-    async def _execute_coder_task(self, task: Task) -> str:
+    def _execute_coder_task(self, task: Task) -> str:
         """Execute coding task.
 
         Args:
@@ -200,7 +218,7 @@ class SwarmCoordinator:
         logger.info(f"Executing coding task: {task.description}")
         return f"Code implementation for: {task.description}"
 
-    async def _execute_tester_task(self, task: Task) -> str:
+    def _execute_tester_task(self, task: Task) -> str:
         """Execute testing task.
 
         Args:
@@ -213,7 +231,7 @@ class SwarmCoordinator:
         logger.info(f"Executing testing task: {task.description}")
         return f"Tests for: {task.description}"
 
-    async def _execute_reviewer_task(self, task: Task) -> str:
+    def _execute_reviewer_task(self, task: Task) -> str:
         """Execute review task.
 
         Args:
@@ -226,7 +244,7 @@ class SwarmCoordinator:
         logger.info(f"Executing review task: {task.description}")
         return f"Review completed for: {task.description}"
 
-    async def _execute_researcher_task(self, task: Task) -> str:
+    def _execute_researcher_task(self, task: Task) -> str:
         """Execute research task.
 
         Args:
@@ -239,7 +257,7 @@ class SwarmCoordinator:
         logger.info(f"Executing research task: {task.description}")
         return f"Research results for: {task.description}"
 
-    async def _execute_coordinator_task(self, task: Task) -> str:
+    def _execute_coordinator_task(self, task: Task) -> str:
         """Execute coordination task.
 
         Args:
@@ -294,6 +312,9 @@ class TaskDistributor:
         """Initialize the distributor."""
         self.agents: dict[str, dict] = {}
         self.queues: dict[AgentRole, list[str]] = {role: [] for role in AgentRole}
+        # Per-role min-heaps of (current_load, agent_id). Entries go stale as
+        # loads change and are reconciled against self.agents when popped.
+        self._heaps: dict[AgentRole, list[tuple[int, str]]] = {role: [] for role in AgentRole}
 
     def register_agent(self, agent_id: str, roles: list[AgentRole], capacity: int = 10) -> None:
         """Register an agent.
@@ -308,6 +329,8 @@ class TaskDistributor:
             "capacity": capacity,
             "current_load": 0,
         }
+        for role in roles:
+            heapq.heappush(self._heaps[role], (0, agent_id))
         logger.info(f"Registered agent: {agent_id} with roles: {[r.value for r in roles]}")
 
     async def distribute_task(self, task: Task) -> Optional[str]:
@@ -319,21 +342,35 @@ class TaskDistributor:
         Returns:
             Agent ID that accepted the task, or None.
         """
-        # Find agents that can perform this role
-        eligible = [
-            (aid, info) for aid, info in self.agents.items()
-            if task.role in info["roles"] and info["current_load"] < info["capacity"]
-        ]
-
-        if not eligible:
+        heap = self._heaps[task.role]
+        full: list[tuple[int, str]] = []
+        chosen: Optional[tuple[str, dict]] = None
+
+        # Pop until the least-loaded entry is current and under capacity
+        while heap:
+            load, aid = heapq.heappop(heap)
+            info = self.agents.get(aid)
+            if info is None or task.role not in info["roles"]:
+                continue
+            if load != info["current_load"]:
+                # Every load change pushes a fresh entry, so this one is stale.
+                continue
+            if load >= info["capacity"]:
+                full.append((load, aid))
+                continue
+            chosen = (aid, info)
+            break
+
+        for entry in full:
+            heapq.heappush(heap, entry)
+
+        if chosen is None:
             return None
 
-        # Select agent with lowest load
-        eligible.sort(key=lambda x: x[1]["current_load"])
-        agent_id, info = eligible[0]
-
         # Assign task
+        agent_id, info = chosen
         info["current_load"] += 1
+        self._push(task.role, info["current_load"], agent_id)
         self.queues[task.role].append(agent_id)
 
         logger.info(f"Distributed task {task.id} to agent {agent_id}")
@@ -345,8 +382,28 @@ class TaskDistributor:
         Args:
             agent_id: Agent that completed a task.
         """
-        if agent_id in self.agents:
-            self.agents[agent_id]["current_load"] = max(0, self.agents[agent_id]["current_load"] - 1)
+        info = self.agents.get(agent_id)
+        if info is None or info["current_load"] == 0:
+            return
+
+        info["current_load"] -= 1
+        for role in info["roles"]:
+            self._push(role, info["current_load"], agent_id)
+
+    def _push(self, role: AgentRole, load: int, agent_id: str) -> None:
+        """Push a fresh heap entry, rebuilding the heap once stale entries dominate."""
+        heap = self._heaps[role]
+        heapq.heappush(heap, (load, agent_id))
+        # Stale entries that share the current load can't be told apart when
+        # popped, so bound the heap instead; the O(agents) rebuild amortises
+        # to O(1) per push.
+        if len(heap) > 2 * len(self.agents):
+            heap[:] = [
+                (info["current_load"], aid)
+                for aid, info in self.agents.items()
+                if role in info["roles"]
+            ]
+            heapq.heapify(heap)
 
     def get_status(self) -> dict:
         """Get status of all agents.
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 
+# Non-empty YAML frontmatter between "---" fences at the start of a file
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL)
+
 
 def find_claude_dir(start_path: Path | None = None) -> Path | None:
     """Find .claude directory by walking up from start_path.
@@ -62,15 +66,11 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
         Tuple of (frontmatter dict, markdown content string).
         If no frontmatter found, returns ({}, content).
     """
-    import re
-
     # First, handle the empty frontmatter case: ---\n---\n...
     if content.startswith("---\n---\n"):
         return {}, content[8:].strip()  # Skip the first 8 chars "---\n---\n"
 
-    # Pattern for non-empty frontmatter
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)"
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if match:
         import yaml
@@ -10,7 +10,8 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Mapping
 
 from friday_ai.agent.events import AgentEvent, AgentEventType
 from friday_ai.claude_integration.utils import load_markdown_file
@@ -20,7 +21,7 @@ from friday_ai.tools.registry import ToolRegistry
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowStep:
     """A single step in a workflow.
 
@@ -31,17 +32,22 @@ class WorkflowStep:
         agent: Optional agent to invoke for this step
         tools: Optional tools available for this step
         verification: Optional verification criteria
+
+    Any iterable of tool names is stored as a tuple, so steps stay hashable.
     """
 
     name: str
     description: str = ""
     prompt: str = ""
     agent: str | None = None
-    tools: list[str] = field(default_factory=list)
+    tools: tuple[str, ...] = ()
     verification: str | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tools", tuple(self.tools))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowDefinition:
     """Definition of a workflow from .claude/workflows/*.md.
 
@@ -49,20 +55,29 @@ class WorkflowDefinition:
         name: Workflow name
         description: Short description
         category: Workflow category (testing, deployment, audit, etc.)
-        steps: Ordered list of workflow steps
-        prerequisites: List of prerequisites
+        steps: Ordered workflow steps
+        prerequisites: Prerequisites
         variables: Available template variables
+
+    Sequences are stored as tuples and variables as a read-only mapping, so a
+    definition shared between executions can't be changed through them.
+    Variables are left out of the hash.
     """
 
     name: str
     description: str = ""
     category: str = "general"
-    steps: list[WorkflowStep] = field(default_factory=list)
-    prerequisites: list[str] = field(default_factory=list)
-    variables: dict[str, Any] = field(default_factory=dict)
+    steps: tuple[WorkflowStep, ...] = ()
+    prerequisites: tuple[str, ...] = ()
+    variables: Mapping[str, Any] = field(default_factory=dict, hash=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "steps", tuple(self.steps))
+        object.__setattr__(self, "prerequisites", tuple(self.prerequisites))
+        object.__setattr__(self, "variables", MappingProxyType(dict(self.variables)))
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkflowState:
     """Current state of a workflow execution.
 
@@ -106,6 +121,40 @@ class WorkflowState:
 class WorkflowEngine:
     """Engine for loading and executing workflows from .claude/workflows/."""
 
+    # Patterns used while parsing workflow markdown, compiled once
+    H1_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+    DESCRIPTION_PATTERN = re.compile(r"^#\s+.+\n\n(.+?)(?:\n\n|$)", re.MULTILINE)
+    # Numbered sections like "## 1. Step Name" or "### Step 1: Name"
+    STEP_PATTERNS = (
+        re.compile(
+            r"(?:^|\n)#{2,3}\s*(?:Step\s*)?(\d+)[.:\s]+(.+?)(?=\n#{2,3}\s*(?:Step\s*)?\d+|$)",
+            re.DOTALL | re.IGNORECASE,
+        ),
+        re.compile(
+            r"(?:^|\n)#{2,3}\s*(\d+)[.:\s]+(.+?)(?=\n#{2,3}\s*\d+|$)",
+            re.DOTALL | re.IGNORECASE,
+        ),
+    )
+    CODE_BLOCK_PATTERN = re.compile(r"```(?:bash|sh|shell)?\n(.+?)```", re.DOTALL)
+    ACTION_PATTERN = re.compile(
+        r"(?:Action|Instruction|Task|Run|Execute):\s*(.+?)(?=\n\n|$)",
+        re.DOTALL | re.IGNORECASE,
+    )
+    PREREQUISITES_PATTERN = re.compile(
+        r"(?:^|\n)#{2,3}\s*(?:Prerequisites|Requirements|Before You Start)\s*\n(.+?)(?=\n#{2,3}|$)",
+        re.DOTALL | re.IGNORECASE,
+    )
+    LIST_ITEM_PATTERN = re.compile(r"[-*]\s*(.+?)(?=\n[-*]|\n\n|$)", re.DOTALL)
+    SHELL_COMMAND_PATTERN = re.compile(r"Execute:\s*(.+?)(?:\n|$)", re.DOTALL)
+
+    CATEGORY_KEYWORDS = {
+        "testing": ("test", "testing", "coverage", "tdd"),
+        "deployment": ("deploy", "release", "publish", "ci", "cd"),
+        "audit": ("audit", "review", "security", "check"),
+        "upgrade": ("upgrade", "update", "migrate"),
+        "setup": ("setup", "init", "configure", "install"),
+    }
+
     def __init__(self, claude_dir: Path | None):
         """Initialize the workflow engine.
 
@@ -157,7 +206,7 @@ class WorkflowEngine:
 
         # Get name from frontmatter, H1, or filename
         name = frontmatter.get("name", path.stem)
-        h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        h1_match = self.H1_PATTERN.search(content)
         if h1_match:
             name = h1_match.group(1).strip()
 
@@ -165,7 +214,7 @@ class WorkflowEngine:
         description = frontmatter.get("description", "")
         if not description:
             # Try first paragraph after H1
-            desc_match = re.search(r"^#\s+.+\n\n(.+?)(?:\n\n|$)", content, re.MULTILINE)
+            desc_match = self.DESCRIPTION_PATTERN.search(content)
             if desc_match:
                 description = desc_match.group(1).strip()
 
@@ -182,23 +231,15 @@ class WorkflowEngine:
             name=name,
             description=description,
             category=category,
-            steps=steps,
-            prerequisites=prerequisites,
+            steps=tuple(steps),
+            prerequisites=tuple(prerequisites),
         )
 
     def _infer_category(self, filename: str) -> str:
         """Infer workflow category from filename."""
         filename_lower = filename.lower()
 
-        categories = {
-            "testing": ["test", "testing", "coverage", "tdd"],
-            "deployment": ["deploy", "release", "publish", "ci", "cd"],
-            "audit": ["audit", "review", "security", "check"],
-            "upgrade": ["upgrade", "update", "migrate"],
-            "setup": ["setup", "init", "configure", "install"],
-        }
-
-        for category, keywords in categories.items():
+        for category, keywords in self.CATEGORY_KEYWORDS.items():
             for keyword in keywords:
                 if keyword in filename_lower:
                     return category
@@ -209,14 +250,8 @@ class WorkflowEngine:
         """Extract workflow steps from content."""
         steps = []
 
-        # Look for numbered sections like "## 1. Step Name" or "### Step 1: Name"
-        step_patterns = [
-            r"(?:^|\n)#{2,3}\s*(?:Step\s*)?(\d+)[.:\s]+(.+?)(?=\n#{2,3}\s*(?:Step\s*)?\d+|$)",
-            r"(?:^|\n)#{2,3}\s*(\d+)[.:\s]+(.+?)(?=\n#{2,3}\s*\d+|$)",
-        ]
-
-        for pattern in step_patterns:
-            matches = list(re.finditer(pattern, content, re.DOTALL | re.IGNORECASE))
+        for pattern in self.STEP_PATTERNS:
+            matches = list(pattern.finditer(content))
             if matches:
                 for i, match in enumerate(matches):
                     step_num = match.group(1)
@@ -247,16 +282,12 @@ class WorkflowEngine:
     def _extract_step_prompt(self, step_content: str) -> str:
         """Extract the actionable prompt from step content."""
         # Look for code blocks that might contain commands
-        code_blocks = re.findall(r"```(?:bash|sh|shell)?\n(.+?)```", step_content, re.DOTALL)
+        code_blocks = self.CODE_BLOCK_PATTERN.findall(step_content)
         if code_blocks:
             return f"Execute the following:\n{code_blocks[0].strip()}"
 
         # Look for action items or instructions
-        action_match = re.search(
-            r"(?:Action|Instruction|Task|Run|Execute):\s*(.+?)(?=\n\n|$)",
-            step_content,
-            re.DOTALL | re.IGNORECASE,
-        )
+        action_match = self.ACTION_PATTERN.search(step_content)
         if action_match:
             return action_match.group(1).strip()
 
@@ -268,16 +299,12 @@ class WorkflowEngine:
         prereqs = []
 
         # Look for Prerequisites section
-        prereq_match = re.search(
-            r"(?:^|\n)#{2,3}\s*(?:Prerequisites|Requirements|Before You Start)\s*\n(.+?)(?=\n#{2,3}|$)",
-            content,
-            re.DOTALL | re.IGNORECASE,
-        )
+        prereq_match = self.PREREQUISITES_PATTERN.search(content)
 
         if prereq_match:
             prereq_section = prereq_match.group(1)
             # Extract list items
-            items = re.findall(r"[-*]\s*(.+?)(?=\n[-*]|\n\n|$)", prereq_section, re.DOTALL)
+            items = self.LIST_ITEM_PATTERN.findall(prereq_section)
             prereqs = [item.strip() for item in items if item.strip()]
 
         return prereqs
@@ -540,7 +567,7 @@ class WorkflowEngine:
             # Parse tool parameters from prompt if it's a shell tool
             if tool_name == "shell" and "Execute:" in prompt:
                 # Extract command from prompt
-                command_match = re.search(r'Execute:\s*(.+?)(?:\n|$)', prompt, re.DOTALL)
+                command_match = self.SHELL_COMMAND_PATTERN.search(prompt)
                 if command_match:
                     command = command_match.group(1).strip()
                     params = {"command": command}
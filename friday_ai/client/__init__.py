@@ -20,6 +20,7 @@ from friday_ai.client.multi_provider import (
     ProviderManager,
     TaskComplexity,
     RoutingCriteria,
+    RoutingRequest,
     ProviderInfo,
 )
 
@@ -47,5 +48,6 @@ __all__ = [
     "ProviderManager",
     "TaskComplexity",
     "RoutingCriteria",
+    "RoutingRequest",
     "ProviderInfo",
 ]
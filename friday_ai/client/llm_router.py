@@ -8,7 +8,8 @@ Agent/Session flow, adding:
 """
 
 import logging
-from collections import defaultdict
+import re
+from functools import lru_cache
 from typing import Optional
 
 from friday_ai.client.multi_provider import (
@@ -19,6 +20,55 @@ from friday_ai.client.multi_provider import (
 
 logger = logging.getLogger(__name__)
 
+# Costs are tracked as integer nano-dollars and converted on read
+_NANOS_PER_DOLLAR = 1_000_000_000
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+# Checked in priority order: EXPERT, then COMPLEX, then MODERATE.
+_EXPERT_RE = _keyword_pattern(["debug", "research", "investigate", "critical"])
+_COMPLEX_RE = _keyword_pattern([
+    "architecture", "design", "implement", "system",
+    "microservices", "distributed", "oauth", "jwt",
+    "websocket", "real-time", "authentication system",
+    "collaboration platform",
+])
+_MODERATE_RE = _keyword_pattern([
+    "review", "explain", "suggest", "improvements",
+    "how", "works", "function",
+])
+
+
+@lru_cache(maxsize=256)
+def _estimate_complexity(prompt: str) -> TaskComplexity:
+    """Classify a prompt; cached so repeated prompts skip the regex scans."""
+    if _EXPERT_RE.search(prompt):
+        return TaskComplexity.EXPERT
+
+    if _COMPLEX_RE.search(prompt):
+        return TaskComplexity.COMPLEX
+
+    if _MODERATE_RE.search(prompt):
+        return TaskComplexity.MODERATE
+
+    # Check length and complexity indicators
+    prompt_length = len(prompt)
+
+    # Simple tasks: short prompts
+    if prompt_length < 100:
+        return TaskComplexity.SIMPLE
+
+    # Moderate tasks: medium length, multi-step
+    if prompt_length < 500:
+        return TaskComplexity.MODERATE
+
+    # Default to COMPLEX for long prompts
+    return TaskComplexity.COMPLEX
+
 
 class LLMRouter:
     """Router for intelligent LLM provider selection and tracking.
@@ -32,8 +82,11 @@ class LLMRouter:
     def __init__(self):
         """Initialize LLM router."""
         self._router = ProviderRouter()
-        self._usage_counts: dict[ProviderType, int] = defaultdict(int)
-        self._costs: dict[ProviderType, float] = defaultdict(float)
+        # One slot per provider type up front, so tracking is plain integer
+        # adds with no missing-key handling.
+        self._usage_counts: dict[ProviderType, int] = dict.fromkeys(ProviderType, 0)
+        self._cost_nanos: dict[ProviderType, int] = dict.fromkeys(ProviderType, 0)
+        self._total_cost_nanos: int = 0
         self._total_requests: int = 0
 
     def estimate_complexity(self, prompt: str) -> TaskComplexity:
@@ -45,43 +98,7 @@ class LLMRouter:
         Returns:
             Estimated task complexity level.
         """
-        prompt_lower = prompt.lower()
-        prompt_length = len(prompt)
-
-        # Check for EXPERT keywords first (highest priority)
-        expert_keywords = ["debug", "research", "investigate", "critical"]
-        if any(keyword in prompt_lower for keyword in expert_keywords):
-            return TaskComplexity.EXPERT
-
-        # Check for COMPLEX keywords (high complexity tasks)
-        complex_keywords = [
-            "architecture", "design", "implement", "system",
-            "microservices", "distributed", "oauth", "jwt",
-            "websocket", "real-time", "authentication system",
-            "collaboration platform",
-        ]
-        if any(keyword in prompt_lower for keyword in complex_keywords):
-            return TaskComplexity.COMPLEX
-
-        # Check for MODERATE keywords (multi-step tasks)
-        moderate_keywords = [
-            "review", "explain", "suggest", "improvements",
-            "how", "works", "function",
-        ]
-        if any(keyword in prompt_lower for keyword in moderate_keywords):
-            return TaskComplexity.MODERATE
-
-        # Check length and complexity indicators
-        # Simple tasks: short prompts
-        if prompt_length < 100:
-            return TaskComplexity.SIMPLE
-
-        # Moderate tasks: medium length, multi-step
-        if prompt_length < 500:
-            return TaskComplexity.MODERATE
-
-        # Default to COMPLEX for long prompts
-        return TaskComplexity.COMPLEX
+        return _estimate_complexity(prompt)
 
     def track_usage(
         self,
@@ -99,14 +116,15 @@ class LLMRouter:
         self._usage_counts[provider_type] += 1
         self._total_requests += 1
 
-        cost = self._router.estimate_cost(
+        cost_nanos = self._router.estimate_cost_nanos(
             provider_type, input_tokens, output_tokens
         )
-        self._costs[provider_type] += cost
+        self._cost_nanos[provider_type] += cost_nanos
+        self._total_cost_nanos += cost_nanos
 
         logger.debug(
             f"Tracked usage: {provider_type.value} "
-            f"+${cost:.4f} ({input_tokens} in, {output_tokens} out)"
+            f"+${cost_nanos / _NANOS_PER_DOLLAR:.4f} ({input_tokens} in, {output_tokens} out)"
         )
 
     def get_usage_count(self, provider_type: ProviderType) -> int:
@@ -118,7 +136,7 @@ class LLMRouter:
         Returns:
             Number of requests made to this provider.
         """
-        return self._usage_counts.get(provider_type, 0)
+        return self._usage_counts[provider_type]
 
     def get_total_cost(self, provider_type: ProviderType) -> float:
         """Get total cost for a provider.
@@ -129,7 +147,7 @@ class LLMRouter:
         Returns:
             Total cost in USD.
         """
-        return self._costs.get(provider_type, 0.0)
+        return self._cost_nanos[provider_type] / _NANOS_PER_DOLLAR
 
     def get_cost_summary(self) -> dict:
         """Get cost summary across all providers.
@@ -137,18 +155,18 @@ class LLMRouter:
         Returns:
             Dictionary with cost statistics.
         """
-        total_cost = sum(self._costs.values())
-
         by_provider = {}
-        for provider_type, cost in self._costs.items():
+        for provider_type, requests in self._usage_counts.items():
+            if not requests:
+                continue
             by_provider[provider_type.value] = {
-                "requests": self._usage_counts[provider_type],
-                "cost": round(cost, 4),
+                "requests": requests,
+                "cost": round(self._cost_nanos[provider_type] / _NANOS_PER_DOLLAR, 4),
             }
 
         return {
             "total_requests": self._total_requests,
-            "total_cost": round(total_cost, 4),
+            "total_cost": round(self._total_cost_nanos / _NANOS_PER_DOLLAR, 4),
             "by_provider": by_provider,
         }
 
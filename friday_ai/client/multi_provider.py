@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
@@ -27,9 +27,12 @@ class TaskComplexity(Enum):
     EXPERT = "expert"  # Complex problem solving, research
 
 
-@dataclass
+@dataclass(frozen=True)
 class RoutingCriteria:
-    """Criteria for selecting the best provider."""
+    """Criteria for selecting the best provider.
+
+    Frozen (and therefore hashable) so selections can be memoized per criteria.
+    """
 
     prefer_speed: bool = False
     prefer_cost: bool = False
@@ -37,7 +40,21 @@ class RoutingCriteria:
     max_cost_per_1k_tokens: float = 1.0
     min_quality_score: float = 0.5
     allow_local: bool = True
-    fallback_providers: list[ProviderType] = field(default_factory=list)
+    fallback_providers: tuple[ProviderType, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (e.g. a list) but store a hashable tuple.
+        object.__setattr__(self, "fallback_providers", tuple(self.fallback_providers))
+
+
+@dataclass(frozen=True)
+class RoutingRequest:
+    """A single request to be routed as part of a batch."""
+
+    complexity: TaskComplexity = TaskComplexity.MODERATE
+    criteria: Optional[RoutingCriteria] = None
+    model: Optional[str] = None
+    payload: Any = None
 
 
 @dataclass
@@ -55,15 +72,38 @@ class ProviderInfo:
     max_tokens: int
 
 
+class _ProviderInfoTable(dict[ProviderType, ProviderInfo]):
+    """Provider info mapping that counts writes so routing caches can detect changes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.version = 0
+
+    def __setitem__(self, key: ProviderType, value: ProviderInfo) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: ProviderType) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+
 class ProviderRouter:
     """Router for intelligently selecting the best LLM provider."""
 
+    # Upper bound on memoized selections before the cache is reset
+    _SELECTION_CACHE_SIZE = 256
+
     def __init__(self):
         """Initialize the provider router."""
         self._providers: dict[ProviderType, BaseProvider] = {}
-        self._provider_info: dict[ProviderType, ProviderInfo] = {}
+        self._provider_info: _ProviderInfoTable = _ProviderInfoTable()
         self._default_provider: Optional[ProviderType] = None
         self._lock = asyncio.Lock()
+        self._selection_cache: dict[tuple, ProviderType] = {}
+        self._selection_version = -1
+        self._rankings: dict[tuple, list[tuple[ProviderType, ProviderInfo]]] = {}
+        self._ranking_version = -1
 
     def register_provider(
         self,
@@ -192,6 +232,10 @@ class ProviderRouter:
     ) -> ProviderType:
         """Select the best provider based on criteria.
 
+        Results are memoized per (complexity, criteria) until provider info
+        changes. Replace entries in ``_provider_info`` rather than mutating
+        them in place so the cache notices.
+
         Args:
             complexity: Task complexity level.
             criteria: Routing criteria.
@@ -202,18 +246,66 @@ class ProviderRouter:
         if criteria is None:
             criteria = RoutingCriteria()
 
-        available_providers = [
-            (pt, info)
-            for pt, info in self._provider_info.items()
-            if info.is_available
-        ]
+        if self._selection_version != self._provider_info.version:
+            self._selection_cache.clear()
+            self._selection_version = self._provider_info.version
+
+        key = (complexity, criteria, self._default_provider)
+        selected = self._selection_cache.get(key)
+        if selected is None:
+            if len(self._selection_cache) >= self._SELECTION_CACHE_SIZE:
+                self._selection_cache.clear()
+            selected = self._rank_providers(complexity, criteria)
+            self._selection_cache[key] = selected
+
+        return selected
+
+    def plan(
+        self, requests: list[RoutingRequest]
+    ) -> dict[ProviderType, list[RoutingRequest]]:
+        """Route a batch of requests, selecting once per distinct group.
+
+        Requests are grouped by (complexity, criteria), the inputs that
+        decide selection, so N requests sharing them cost one
+        ``select_provider`` call.
+
+        Args:
+            requests: Requests to route.
+
+        Returns:
+            Requests grouped by the provider chosen for them, in input order.
+        """
+        groups: dict[tuple[TaskComplexity, Optional[RoutingCriteria]], list[RoutingRequest]] = {}
+        for request in requests:
+            groups.setdefault((request.complexity, request.criteria), []).append(request)
+
+        routed: dict[ProviderType, list[RoutingRequest]] = {}
+        for (complexity, criteria), grouped in groups.items():
+            provider_type = self.select_provider(complexity, criteria)
+            routed.setdefault(provider_type, []).extend(grouped)
+
+        return routed
+
+    def _rank_providers(
+        self,
+        complexity: TaskComplexity,
+        criteria: RoutingCriteria,
+    ) -> ProviderType:
+        """Pick the best-ranked provider that satisfies the criteria filters.
+
+        Args:
+            complexity: Task complexity level.
+            criteria: Routing criteria.
+
+        Returns:
+            Selected provider type.
+        """
+        ranked = self._get_ranking(complexity, criteria.prefer_speed, criteria.prefer_cost)
 
-        if not available_providers:
+        if not ranked:
             return self._default_provider or ProviderType.OPENAI
 
-        # Filter by criteria
-        filtered_providers = []
-        for pt, info in available_providers:
+        for pt, info in ranked:
             # Skip local if not allowed
             if pt == ProviderType.OLLAMA and not criteria.allow_local:
                 continue
@@ -227,63 +319,102 @@ class ProviderRouter:
             if info.quality_score < criteria.min_quality_score:
                 continue
 
-            filtered_providers.append((pt, info))
-
-        if not filtered_providers:
-            # Return cheapest available if none meet criteria
-            filtered_providers = available_providers
-
-        # Score and rank providers
-        def score_provider(pt_info: tuple[ProviderType, ProviderInfo]) -> float:
-            pt, info = pt_info
-            score = 0.0
-
-            # Adjust based on task complexity
-            if complexity == TaskComplexity.SIMPLE:
-                # Prefer fast, cheap providers
-                if criteria.prefer_speed:
-                    score += (1000 - info.avg_latency_ms) / 1000 * 0.4
-                if criteria.prefer_cost:
-                    score += (1.0 - info.cost_per_1k_output) * 0.4
-                score += info.quality_score * 0.2
-
-            elif complexity == TaskComplexity.MODERATE:
-                # Balance of speed, cost, quality
-                if criteria.prefer_speed:
-                    score += (1000 - info.avg_latency_ms) / 1000 * 0.3
-                if criteria.prefer_cost:
-                    score += (1.0 - info.cost_per_1k_output) * 0.3
-                score += info.quality_score * 0.4
-
-            else:  # COMPLEX or EXPERT
-                # Prefer quality
-                score += info.quality_score * 0.6
-                if criteria.prefer_speed:
-                    score += (1000 - info.avg_latency_ms) / 1000 * 0.2
-                if criteria.prefer_cost:
-                    score += (1.0 - info.cost_per_1k_output) * 0.2
-
-            # Boost for streaming support
-            if info.supports_streaming:
-                score += 0.05
+            return pt
+
+        # Nothing meets the criteria: fall back to the best available provider
+        return ranked[0][0]
 
-            # Boost for higher max tokens on complex tasks
-            if complexity in (TaskComplexity.COMPLEX, TaskComplexity.EXPERT):
-                if info.max_tokens >= 16384:
-                    score += 0.1
-                elif info.max_tokens >= 8192:
-                    score += 0.05
+    def _get_ranking(
+        self,
+        complexity: TaskComplexity,
+        prefer_speed: bool,
+        prefer_cost: bool,
+    ) -> list[tuple[ProviderType, ProviderInfo]]:
+        """Get available providers sorted by score, best first.
 
-            return score
+        Scores only depend on the complexity tier and the speed/cost
+        preferences, so each ranking is computed once per provider-info
+        version and shared by every criteria that differs only in its
+        filter thresholds.
 
-        # Sort by score and return best
-        filtered_providers.sort(key=score_provider, reverse=True)
+        Args:
+            complexity: Task complexity level.
+            prefer_speed: Whether latency is weighted.
+            prefer_cost: Whether cost is weighted.
 
-        # Apply fallback if primary fails
-        if filtered_providers:
-            return filtered_providers[0][0]
+        Returns:
+            Ranked (provider type, info) pairs.
+        """
+        if self._ranking_version != self._provider_info.version:
+            self._rankings.clear()
+            self._ranking_version = self._provider_info.version
+
+        key = (complexity, prefer_speed, prefer_cost)
+        ranked = self._rankings.get(key)
+        if ranked is None:
+            ranked = [
+                (pt, info)
+                for pt, info in self._provider_info.items()
+                if info.is_available
+            ]
+            # Stable sort keeps registration order for equal scores
+            ranked.sort(
+                key=lambda pt_info: self._score_provider(
+                    pt_info[1], complexity, prefer_speed, prefer_cost
+                ),
+                reverse=True,
+            )
+            self._rankings[key] = ranked
+
+        return ranked
+
+    @staticmethod
+    def _score_provider(
+        info: ProviderInfo,
+        complexity: TaskComplexity,
+        prefer_speed: bool,
+        prefer_cost: bool,
+    ) -> float:
+        """Score a provider for a complexity tier and preference weights."""
+        score = 0.0
+
+        # Adjust based on task complexity
+        if complexity == TaskComplexity.SIMPLE:
+            # Prefer fast, cheap providers
+            if prefer_speed:
+                score += (1000 - info.avg_latency_ms) / 1000 * 0.4
+            if prefer_cost:
+                score += (1.0 - info.cost_per_1k_output) * 0.4
+            score += info.quality_score * 0.2
+
+        elif complexity == TaskComplexity.MODERATE:
+            # Balance of speed, cost, quality
+            if prefer_speed:
+                score += (1000 - info.avg_latency_ms) / 1000 * 0.3
+            if prefer_cost:
+                score += (1.0 - info.cost_per_1k_output) * 0.3
+            score += info.quality_score * 0.4
+
+        else:  # COMPLEX or EXPERT
+            # Prefer quality
+            score += info.quality_score * 0.6
+            if prefer_speed:
+                score += (1000 - info.avg_latency_ms) / 1000 * 0.2
+            if prefer_cost:
+                score += (1.0 - info.cost_per_1k_output) * 0.2
+
+        # Boost for streaming support
+        if info.supports_streaming:
+            score += 0.05
+
+        # Boost for higher max tokens on complex tasks
+        if complexity in (TaskComplexity.COMPLEX, TaskComplexity.EXPERT):
+            if info.max_tokens >= 16384:
+                score += 0.1
+            elif info.max_tokens >= 8192:
+                score += 0.05
 
-        return self._default_provider or ProviderType.OPENAI
+        return score
 
     async def complete(
         self,
@@ -344,6 +475,34 @@ class ProviderRouter:
             (output_tokens / 1000) * info.cost_per_1k_output
         )
 
+    def estimate_cost_nanos(
+        self,
+        provider_type: ProviderType,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> int:
+        """Estimate cost for a provider as integer nano-dollars.
+
+        Per-1k prices are converted to micro-dollars, so multiplying by a
+        token count yields exact nano-dollars with no float accumulation.
+
+        Args:
+            provider_type: Provider type.
+            input_tokens: Number of input tokens.
+            output_tokens: Number of output tokens.
+
+        Returns:
+            Estimated cost in nano-dollars (1e-9 USD).
+        """
+        info = self._provider_info.get(provider_type)
+        if info is None:
+            return 0
+
+        return (
+            input_tokens * round(info.cost_per_1k_input * 1_000_000) +
+            output_tokens * round(info.cost_per_1k_output * 1_000_000)
+        )
+
     def get_provider_status(self) -> dict[str, Any]:
         """Get status of all providers.
 
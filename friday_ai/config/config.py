@@ -65,10 +65,11 @@ class HookTrigger(str, Enum):
 class HookConfig(BaseModel):
     name: str
     trigger: HookTrigger
-    command: str | None = None  # python3 tests.py
+    command: str | list[str] | None = None  # "python3 tests.py" or ["python3", "tests.py"]
     script: str | None = None  # *.sh
     timeout_sec: float = 30
     enabled: bool = True
+    capture_output: bool = False  # pipe stdout/stderr into HookResult
 
     @model_validator(mode="after")
     def validate_hook(self) -> HookConfig:
@@ -83,6 +84,10 @@ class Config(BaseModel):
     shell_environment: ShellEnvironmentPolicy = Field(default_factory=ShellEnvironmentPolicy)
     hooks_enabled: bool = False
     hooks: list[HookConfig] = Field(default_factory=list)
+    hooks_total_timeout_sec: float | None = Field(
+        None, description="Wall-clock cap for all hooks of one trigger; None means no cap"
+    )
+    hooks_max_parallel: int = Field(default=8, ge=1)
     approval: ApprovalPolicy = ApprovalPolicy.ON_REQUEST
     max_turns: int = 100
     mcp_servers: dict[str, MCPServerConfig] = Field(default_factory=dict)
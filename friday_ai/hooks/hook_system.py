@@ -1,25 +1,90 @@
 import asyncio
 import json
+import logging
 import os
 import signal
 import sys
 import tempfile
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Literal, TypeAlias
 from friday_ai.config.config import Config, HookConfig, HookTrigger
 from friday_ai.tools.base import ToolResult
 
+logger = logging.getLogger(__name__)
+
+# POSIX spawns take a bytes env as-is, so hook envs are built from
+# os.environb with values encoded once per trigger instead of subprocess
+# re-encoding every variable for every hook. Windows has no bytes environ;
+# branching on sys.platform lets type checkers see a single Env per target.
+if sys.platform == "win32":
+    Env: TypeAlias = dict[str, str]
+    _encode = str
+    _environ = os.environ
+else:
+    Env: TypeAlias = dict[bytes, bytes]
+    _encode = os.fsencode
+    _environ = os.environb
+
+_TRIGGER_KEY = _encode("AI_AGENT_TRIGGER")
+_CWD_KEY = _encode("AI_AGENT_CWD")
+_TOOL_NAME_KEY = _encode("AI_AGENT_TOOL_NAME")
+_TOOL_PARAMS_KEY = _encode("AI_AGENT_TOOL_PARAMS")
+_TOOL_RESULT_KEY = _encode("AI_AGENT_TOOL_RESULT")
+_USER_MESSAGE_KEY = _encode("AI_AGENT_USER_MESSAGE")
+_RESPONSE_KEY = _encode("AI_AGENT_RESPONSE")
+_ERROR_KEY = _encode("AI_AGENT_ERROR")
+
+
+@dataclass(slots=True)
+class HookResult:
+    """Outcome of one hook subprocess."""
+
+    status: Literal["ok", "timeout", "spawn_error", "nonzero"]
+    returncode: int | None
+    duration_ms: float
+    stdout: bytes = b""
+    stderr: bytes = b""
+
 
 class HookSystem:
     def __init__(self, config: Config):
         self.config = config
-        self.hooks: list[HookConfig] = []
-        if self.config.hooks_enabled:
+        # Bound once: cwd doesn't change mid-session, and plain attributes
+        # keep the per-fire path off the pydantic model.
+        self._cwd = str(config.cwd)
+        self._cwd_env = _encode(self._cwd)
+        self._enabled = bool(config.hooks_enabled)
+        self._total_timeout = config.hooks_total_timeout_sec
+        # Snapshot the parent environment once; every hook fire copies this
+        # instead of re-reading os.environ.
+        self._base_env: Env = dict(_environ)
+        self._by_trigger: dict[HookTrigger, list[HookConfig]] = {}
+        # Shared across triggers so concurrent hooks can't fork-bomb the host.
+        self._sem = asyncio.Semaphore(config.hooks_max_parallel)
+        self.hooks = []
+        if self._enabled:
             self.hooks = [hook for hook in self.config.hooks if hook.enabled]
 
-    async def _run_hook(self, hook: HookConfig, env: dict[str, str]) -> None:
+    @property
+    def hooks(self) -> list[HookConfig]:
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, hooks: list[HookConfig]) -> None:
+        # Index hooks by trigger up front so each fire is a dict lookup
+        # rather than a scan over every configured hook.
+        self._hooks = hooks
+        self._by_trigger = {trigger: [] for trigger in HookTrigger}
+        for hook in hooks:
+            self._by_trigger[hook.trigger].append(hook)
+
+    async def _run_hook(self, hook: HookConfig, env: Env) -> HookResult | None:
         try:
             if hook.command:
-                await self._run_command(hook.command, hook.timeout_sec, env)
+                result = await self._run_command(
+                    hook.command, hook.timeout_sec, env, hook.capture_output
+                )
             else:
                 with tempfile.NamedTemporaryFile(
                     mode="w", suffix=".sh", delete=False
@@ -29,35 +94,118 @@ class HookSystem:
                     script_path = f.name
                 try:
                     os.chmod(script_path, 0o755)
-                    await self._run_command(script_path, hook.timeout_sec, env)
+                    result = await self._run_command(
+                        [script_path], hook.timeout_sec, env, hook.capture_output
+                    )
                 finally:
                     os.unlink(script_path)
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception(f"Hook {hook.name} failed")
+            return None
+
+        if result.status == "timeout":
+            logger.warning(f"Hook {hook.name} timed out after {hook.timeout_sec}s")
+        elif result.status == "spawn_error":
+            logger.warning(f"Hook {hook.name} could not be started")
+        elif result.status == "nonzero":
+            logger.debug(f"Hook {hook.name} exited with code {result.returncode}")
+
+        return result
+
+    async def _run_hooks(self, trigger: HookTrigger, env: Env) -> list[HookResult]:
+        # Hooks for the same trigger are independent, so overlap their
+        # subprocess startup and wait time instead of running them serially.
+        # The TaskGroup ties every hook to this call: cancelling the trigger
+        # (or exceeding the total budget) cancels the hooks, and _run_command
+        # kills their subprocesses on the way out.
+        tasks: list[asyncio.Task[HookResult | None]] = []
+        try:
+            async with asyncio.timeout(self._total_timeout):
+                async with asyncio.TaskGroup() as tg:
+                    for hook in self._by_trigger[trigger]:
+                        tasks.append(tg.create_task(self._run_hook(hook, env)))
+        except TimeoutError:
+            logger.warning(
+                f"{trigger.value} hooks exceeded total budget of "
+                f"{self._total_timeout}s"
+            )
+
+        # Hooks cut off by the budget or that failed to run have no result.
+        return [
+            result
+            for task in tasks
+            if not task.cancelled() and (result := task.result()) is not None
+        ]
 
     async def _run_command(
         self,
-        command: str,
+        command: str | list[str],
         timeout: float,
-        env: dict[str, str],
-    ) -> None:
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=self.config.cwd,
-            env=env,
-            start_new_session=True,
-        )
+        env: Env,
+        capture: bool = False,
+    ) -> HookResult:
+        # Uncaptured output goes straight to /dev/null: no pipes to allocate
+        # or drain, and communicate() reduces to waiting for exit.
+        stream = asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL
+        async with self._sem:
+            start = time.perf_counter()
+            try:
+                # argv lists are exec'd directly; only plain strings pay for a shell.
+                if isinstance(command, list):
+                    process = await asyncio.create_subprocess_exec(
+                        *command,
+                        stdout=stream,
+                        stderr=stream,
+                        cwd=self._cwd,
+                        env=env,
+                        start_new_session=True,
+                    )
+                else:
+                    process = await asyncio.create_subprocess_shell(
+                        command,
+                        stdout=stream,
+                        stderr=stream,
+                        cwd=self._cwd,
+                        env=env,
+                        start_new_session=True,
+                    )
+            except OSError:
+                return HookResult(
+                    "spawn_error", None, (time.perf_counter() - start) * 1000
+                )
+
+            try:
+                # communicate() drains stdout/stderr while waiting, so hooks that
+                # stall mid-output are bounded by the same timeout.
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                return HookResult("timeout", None, (time.perf_counter() - start) * 1000)
+            else:
+                return HookResult(
+                    "ok" if process.returncode == 0 else "nonzero",
+                    process.returncode,
+                    (time.perf_counter() - start) * 1000,
+                    stdout or b"",
+                    stderr or b"",
+                )
+            finally:
+                # Reap on timeout and on cancellation so no hook outlives its trigger.
+                if process.returncode is None:
+                    self._kill_process(process)
+                    await process.wait()
 
+    @staticmethod
+    def _kill_process(process: asyncio.subprocess.Process) -> None:
         try:
-            await asyncio.wait_for(process.communicate(), timeout=timeout)
-        except asyncio.TimeoutError:
             if sys.platform != "win32":
                 os.killpg(os.getpgid(process.pid), signal.SIGKILL)
             else:
                 process.kill()
-            await process.wait()
+        except ProcessLookupError:
+            # Exited between the timeout firing and the kill.
+            pass
 
     def _build_env(
         self,
@@ -65,58 +213,69 @@ class HookSystem:
         tool_name: str | None = None,
         user_message: str | None = None,
         error: Exception | None = None,
-    ) -> dict[str, str]:
-        env = os.environ.copy()
-        env["AI_AGENT_TRIGGER"] = trigger.value
-        env["AI_AGENT_CWD"] = str(self.config.cwd)
+        tool_params_json: str | None = None,
+    ) -> Env:
+        env = self._base_env.copy()
+        env[_TRIGGER_KEY] = _encode(trigger.value)
+        env[_CWD_KEY] = self._cwd_env
 
         if tool_name:
-            env["AI_AGENT_TOOL_NAME"] = tool_name
+            env[_TOOL_NAME_KEY] = _encode(tool_name)
 
         if user_message:
-            env["AI_AGENT_USER_MESSAGE"] = user_message
+            env[_USER_MESSAGE_KEY] = _encode(user_message)
 
         if error:
-            env["AI_AGENT_ERROR"] = str(error)
+            env[_ERROR_KEY] = _encode(str(error))
+
+        if tool_params_json is not None:
+            env[_TOOL_PARAMS_KEY] = _encode(tool_params_json)
 
         return env
 
     async def trigger_before_agent(self, user_message: str) -> None:
+        if not self._by_trigger[HookTrigger.BEFORE_AGENT]:
+            return
+
         env = self._build_env(
             HookTrigger.BEFORE_AGENT,
             user_message=user_message,
         )
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.BEFORE_AGENT:
-                await self._run_hook(hook, env)
+        await self._run_hooks(HookTrigger.BEFORE_AGENT, env)
 
     async def trigger_after_agent(
         self,
         user_message: str,
         agent_response: str,
     ) -> None:
+        if not self._by_trigger[HookTrigger.AFTER_AGENT]:
+            return
+
         env = self._build_env(
             HookTrigger.AFTER_AGENT,
             user_message=user_message,
         )
-        env["AI_AGENT_RESPONSE"] = agent_response
+        env[_RESPONSE_KEY] = _encode(agent_response)
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.AFTER_AGENT:
-                await self._run_hook(hook, env)
+        await self._run_hooks(HookTrigger.AFTER_AGENT, env)
 
     async def trigger_before_tool(
         self,
         tool_name: str,
         tool_params: dict[str, Any],
     ) -> None:
-        env = self._build_env(HookTrigger.BEFORE_TOOL, tool_name=tool_name)
-        env["AI_AGENT_TOOL_PARAMS"] = json.dumps(tool_params)
+        if not self._by_trigger[HookTrigger.BEFORE_TOOL]:
+            return
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.BEFORE_TOOL:
-                await self._run_hook(hook, env)
+        # Serialized once per trigger; every hook shares the same env.
+        env = self._build_env(
+            HookTrigger.BEFORE_TOOL,
+            tool_name=tool_name,
+            tool_params_json=json.dumps(tool_params, default=str),
+        )
+
+        await self._run_hooks(HookTrigger.BEFORE_TOOL, env)
 
     async def trigger_after_tool(
         self,
@@ -124,17 +283,22 @@ class HookSystem:
         tool_params: dict[str, Any],
         tool_result: ToolResult,
     ) -> None:
-        env = self._build_env(HookTrigger.AFTER_TOOL, tool_name=tool_name)
-        env["AI_AGENT_TOOL_PARAMS"] = json.dumps(tool_params)
-        env["AI_AGENT_TOOL_RESULT"] = tool_result.to_model_output()
+        if not self._by_trigger[HookTrigger.AFTER_TOOL]:
+            return
+
+        env = self._build_env(
+            HookTrigger.AFTER_TOOL,
+            tool_name=tool_name,
+            tool_params_json=json.dumps(tool_params, default=str),
+        )
+        env[_TOOL_RESULT_KEY] = _encode(tool_result.to_model_output())
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.AFTER_TOOL:
-                await self._run_hook(hook, env)
+        await self._run_hooks(HookTrigger.AFTER_TOOL, env)
 
     async def trigger_on_error(self, error: Exception) -> None:
+        if not self._by_trigger[HookTrigger.ON_ERROR]:
+            return
+
         env = self._build_env(HookTrigger.ON_ERROR, error=error)
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.ON_ERROR:
-                await self._run_hook(hook, env)
+        await self._run_hooks(HookTrigger.ON_ERROR, env)
@@ -6,17 +6,71 @@ Supports multiple backends for generating text embeddings:
 - OPENAI: OpenAI embeddings API (requires openai package)
 
 All backends produce 384-dimensional embeddings (same as OpenAI).
+
+Similarity uses SimSIMD kernels when installed, then NumPy, then pure Python.
 """
 
+import array
 import hashlib
 import logging
 from enum import Enum
 from functools import lru_cache
-from typing import Optional
+from typing import Optional, cast
+
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 logger = logging.getLogger(__name__)
 
 
+def _cosine_simsimd(vec1: list[float], vec2: list[float]) -> float:
+    """Cosine similarity via SimSIMD (returns distance, so invert it)."""
+    if not any(vec1) or not any(vec2):
+        return 0.0
+    a = memoryview(array.array("f", vec1))
+    b = memoryview(array.array("f", vec2))
+    # Two vectors and no out= buffer always yield a scalar distance.
+    return 1.0 - cast(float, simsimd.cosine(a, b))
+
+
+def _cosine_numpy(vec1: list[float], vec2: list[float]) -> float:
+    """Cosine similarity via NumPy."""
+    a = np.asarray(vec1, dtype=np.float32)
+    b = np.asarray(vec2, dtype=np.float32)
+    norm1 = float(np.linalg.norm(a))
+    norm2 = float(np.linalg.norm(b))
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return float(np.dot(a, b)) / (norm1 * norm2)
+
+
+def _cosine_python(vec1: list[float], vec2: list[float]) -> float:
+    """Cosine similarity in pure Python (no optional dependencies)."""
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = sum(a * a for a in vec1) ** 0.5
+    norm2 = sum(b * b for b in vec2) ** 0.5
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return dot_product / (norm1 * norm2)
+
+
+if HAS_SIMSIMD:
+    _cosine = _cosine_simsimd
+elif HAS_NUMPY:
+    _cosine = _cosine_numpy
+else:
+    _cosine = _cosine_python
+
+
 class EmbeddingError(Exception):
     """Exception raised for embedding-related errors."""
 
@@ -45,6 +99,8 @@ class EmbeddingService:
     # Standard embedding dimension (OpenAI compatible)
     EMBEDDING_DIM = 384
 
+    __slots__ = ("_model", "_model_name", "backend", "_cache")
+
     def __init__(
         self,
         backend: Optional[EmbeddingBackend] = None,
@@ -315,15 +371,8 @@ class EmbeddingService:
             vec1 = vec1 + [0.0] * (max_len - len(vec1))
             vec2 = vec2 + [0.0] * (max_len - len(vec2))
 
-        # Calculate cosine similarity
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        similarity = dot_product / (norm1 * norm2)
+        # Calculate cosine similarity (fastest available kernel)
+        similarity = _cosine(vec1, vec2)
 
         # Ensure in [0, 1]
         return max(0.0, min(1.0, similarity))
@@ -168,9 +168,10 @@ class DatabaseTool(Tool):
 
         try:
             if db_type == "sqlite":
-                # Use parameterized query for PRAGMA with table name validation
-                query = "PRAGMA table_info(?)"
-                return await self._sqlite_query(connection, query, (table,))
+                # PRAGMA doesn't support parameters for table names
+                # Table name is validated by _is_safe_table_name above
+                query = f'PRAGMA table_info("{table}")'
+                return await self._sqlite_query(connection, query)
             elif db_type == "postgresql":
                 query = """
                     SELECT column_name, data_type, is_nullable
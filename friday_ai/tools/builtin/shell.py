@@ -1,4 +1,5 @@
 import asyncio
+import fnmatch
 import os
 from pathlib import Path
 import signal
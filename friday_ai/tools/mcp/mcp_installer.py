@@ -247,6 +247,8 @@ class MCPServerManager:
         """Initialize the server manager."""
         self.installer = MCPInstaller()
         self._servers: dict[str, dict] = {}
+        # Merged registry + custom listing; rebuilt only after add/remove.
+        self._cached_list: Optional[tuple[dict, ...]] = None
 
     def add_custom_server(
         self,
@@ -272,6 +274,7 @@ class MCPServerManager:
             "description": description or f"Custom MCP server: {name}",
             "custom": True,
         }
+        self._cached_list = None
 
     def remove_server(self, name: str) -> bool:
         """Remove a custom MCP server.
@@ -284,6 +287,7 @@ class MCPServerManager:
         """
         if name in self._servers:
             del self._servers[name]
+            self._cached_list = None
             return True
         return False
 
@@ -293,31 +297,35 @@ class MCPServerManager:
         Returns:
             List of server configurations.
         """
-        servers = []
-
-        # Add registry servers
-        for name, info in MCP_SERVER_REGISTRY.items():
-            servers.append({
-                "name": name,
-                "description": info.description,
-                "category": info.category,
-                "popularity": info.popularity,
-                "requires_api_key": info.requires_api_key,
-                "custom": False,
-            })
-
-        # Add custom servers
-        for name, config in self._servers.items():
-            servers.append({
-                "name": name,
-                "description": config.get("description", ""),
-                "category": "Custom",
-                "popularity": 0,
-                "requires_api_key": bool(config.get("env", {})),
-                "custom": True,
-            })
-
-        return servers
+        if self._cached_list is None:
+            servers = []
+
+            # Add registry servers
+            for name, info in MCP_SERVER_REGISTRY.items():
+                servers.append({
+                    "name": name,
+                    "description": info.description,
+                    "category": info.category,
+                    "popularity": info.popularity,
+                    "requires_api_key": info.requires_api_key,
+                    "custom": False,
+                })
+
+            # Add custom servers
+            for name, config in self._servers.items():
+                servers.append({
+                    "name": name,
+                    "description": config.get("description", ""),
+                    "category": "Custom",
+                    "popularity": 0,
+                    "requires_api_key": bool(config.get("env", {})),
+                    "custom": True,
+                })
+
+            self._cached_list = tuple(servers)
+
+        # Copy each entry too, so callers can't mutate the cached dicts.
+        return [dict(server) for server in self._cached_list]
 
     def get_server_config(self, name: str) -> Optional[dict]:
         """Get configuration for a specific server.
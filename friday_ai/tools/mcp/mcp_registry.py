@@ -1,6 +1,7 @@
 """MCP Server Registry - Known and popular MCP servers."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -214,7 +215,7 @@ def list_servers_by_category(category: str) -> list[MCPServerInfo]:
     Returns:
         List of servers in the category.
     """
-    return [s for s in MCP_SERVER_REGISTRY.values() if s.category.lower() == category.lower()]
+    return list(_SERVERS_BY_CATEGORY.get(category.lower(), ()))
 
 
 def get_all_categories() -> list[str]:
@@ -223,7 +224,7 @@ def get_all_categories() -> list[str]:
     Returns:
         List of category names.
     """
-    return list(set(s.category for s in MCP_SERVER_REGISTRY.values()))
+    return list(_CATEGORIES)
 
 
 def search_servers(query: str) -> list[MCPServerInfo]:
@@ -235,11 +236,7 @@ def search_servers(query: str) -> list[MCPServerInfo]:
     Returns:
         List of matching servers.
     """
-    query_lower = query.lower()
-    return [
-        s for s in MCP_SERVER_REGISTRY.values()
-        if query_lower in s.name.lower() or query_lower in s.description.lower()
-    ]
+    return list(_search_servers(query.lower()))
 
 
 def get_popular_servers(min_popularity: int = 4) -> list[MCPServerInfo]:
@@ -251,7 +248,7 @@ def get_popular_servers(min_popularity: int = 4) -> list[MCPServerInfo]:
     Returns:
         List of popular servers.
     """
-    return [s for s in MCP_SERVER_REGISTRY.values() if s.popularity >= min_popularity]
+    return list(_popular_servers(min_popularity))
 
 
 def get_quick_install_servers() -> list[MCPServerInfo]:
@@ -260,4 +257,32 @@ def get_quick_install_servers() -> list[MCPServerInfo]:
     Returns:
         List of servers without API key requirements.
     """
-    return [s for s in MCP_SERVER_REGISTRY.values() if not s.requires_api_key]
+    return list(_QUICK_INSTALL_SERVERS)
+
+
+# The registry is static, so lookups are indexed once at import and query
+# results are memoized. Helpers hand back fresh lists so callers can't
+# mutate the cached tuples.
+_SERVERS_BY_CATEGORY: dict[str, tuple[MCPServerInfo, ...]] = {}
+for _server in MCP_SERVER_REGISTRY.values():
+    _key = _server.category.lower()
+    _SERVERS_BY_CATEGORY[_key] = (*_SERVERS_BY_CATEGORY.get(_key, ()), _server)
+del _server, _key
+
+_CATEGORIES: tuple[str, ...] = tuple(set(s.category for s in MCP_SERVER_REGISTRY.values()))
+_QUICK_INSTALL_SERVERS: tuple[MCPServerInfo, ...] = tuple(
+    s for s in MCP_SERVER_REGISTRY.values() if not s.requires_api_key
+)
+
+
+@lru_cache(maxsize=256)
+def _search_servers(query_lower: str) -> tuple[MCPServerInfo, ...]:
+    return tuple(
+        s for s in MCP_SERVER_REGISTRY.values()
+        if query_lower in s.name.lower() or query_lower in s.description.lower()
+    )
+
+
+@lru_cache(maxsize=256)
+def _popular_servers(min_popularity: int) -> tuple[MCPServerInfo, ...]:
+    return tuple(s for s in MCP_SERVER_REGISTRY.values() if s.popularity >= min_popularity)
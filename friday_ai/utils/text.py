@@ -1,6 +1,11 @@
+import fnmatch
+import re
+from functools import lru_cache
+
 import tiktoken
 
 
+@lru_cache(maxsize=8)
 def get_tokenizer(model: str):
     try:
         encoding = tiktoken.encoding_for_model(model)
@@ -79,25 +84,30 @@ def _truncate_by_chars(text: str, target_tokens: int, suffix: str, model: str) -
     return text[:low] + suffix
 
 
+@lru_cache(maxsize=256)
+def _compiled(pattern: str) -> re.Pattern[str] | None:
+    """Compile a glob pattern to a case-insensitive search regex, once."""
+    # Simple glob-to-regex conversion for basic patterns like *KEY*
+    regex_pattern = fnmatch.translate(pattern)
+    # fnmatch.translate adds \Z to the end, which we don't want for searching within text
+    if regex_pattern.endswith("\\Z"):
+        regex_pattern = regex_pattern[:-2]
+
+    try:
+        return re.compile(regex_pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
 def scrub_secrets(text: str, patterns: list[str]) -> str:
     """Mask sensitive information in text based on patterns"""
-    import fnmatch
-    import re
-
-    if not patterns:
+    if not patterns or not text:
         return text
 
     scrubbed = text
     for pattern in patterns:
-        # Simple glob-to-regex conversion for basic patterns like *KEY*
-        regex_pattern = fnmatch.translate(pattern)
-        # fnmatch.translate adds \Z to the end, which we don't want for searching within text
-        if regex_pattern.endswith("\\Z"):
-            regex_pattern = regex_pattern[:-2]
-        
-        try:
-            scrubbed = re.sub(regex_pattern, "[REDACTED]", scrubbed, flags=re.IGNORECASE)
-        except re.error:
-            continue
+        compiled = _compiled(pattern)
+        if compiled is not None:
+            scrubbed = compiled.sub("[REDACTED]", scrubbed)
 
     return scrubbed
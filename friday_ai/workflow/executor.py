@@ -17,7 +17,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Sequence
 
 from friday_ai.agent.agent import Agent
 from friday_ai.agent.events import AgentEvent, AgentEventType
@@ -297,7 +297,7 @@ class WorkflowExecutor:
         self,
         agent_name: str,
         prompt: str,
-        tools: list[str] | None = None,
+        tools: Sequence[str] | None = None,
     ) -> str:
         """Delegate task to a sub-agent.
 
@@ -0,0 +1,67 @@
+"""Shared pytest configuration."""
+
+import asyncio
+import sys
+
+import pytest
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = sys.platform != "win32"
+except ImportError:
+    HAS_UVLOOP = False
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it's installed."""
+    if HAS_UVLOOP:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture
+async def eager_tasks():
+    """Run new tasks eagerly until they first suspend (Python 3.12+)."""
+    if not hasattr(asyncio, "eager_task_factory"):
+        yield
+        return
+
+    # The loop is shared across the session, so put the old factory back.
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(previous)
+
+
+@pytest.fixture(scope="session")
+def warm_tokenizers():
+    """Load the gpt-4 and fallback encodings once, before tests time them."""
+    from friday_ai.utils.text import get_tokenizer
+
+    for model in ("gpt-4", "cl100k_base"):
+        try:
+            get_tokenizer(model)
+        except Exception:
+            # Offline runs can't fetch the BPE files; the tests report that.
+            pass
+
+
+class StubAgent:
+    """Minimal async agent that records the tasks it was asked to execute."""
+
+    def __init__(self, result=None):
+        self.calls = []
+        self._result = result
+
+    async def execute(self, task):
+        self.calls.append(task)
+        return self._result
+
+
+@pytest.fixture
+def stub_agent():
+    """Factory for StubAgent, a cheaper stand-in for AsyncMock agents."""
+    return StubAgent
@@ -1,26 +1,62 @@
 """Comprehensive tests for hooks system module."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+import os
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from friday_ai.hooks.hook_system import HookSystem
-from friday_ai.config.config import Config, HookConfig, HookTrigger
+from friday_ai.config.config import HookConfig, HookTrigger
 from friday_ai.tools.base import ToolResult
 
 
+@dataclass
+class FakeHook:
+    """Plain stand-in for HookConfig; attribute reads cost far less than on a MagicMock."""
+
+    id: str = ""
+    name: str = "hook"
+    enabled: bool = True
+    trigger: HookTrigger = HookTrigger.BEFORE_TOOL
+    script: str | None = None
+    command: str | list[str] | None = None
+    timeout_sec: float = 5
+    capture_output: bool = False
+
+
+def str_env(env):
+    """Decode a hook env (bytes on POSIX) back to str for assertions."""
+    return {os.fsdecode(key): os.fsdecode(value) for key, value in env.items()}
+
+
+def fake_config(
+    cwd="/tmp",
+    hooks_enabled=True,
+    hooks=None,
+    hooks_total_timeout_sec=None,
+    hooks_max_parallel=8,
+):
+    """Build the minimal config surface HookSystem reads."""
+    return SimpleNamespace(
+        cwd=cwd,
+        hooks_enabled=hooks_enabled,
+        hooks=hooks or [],
+        hooks_total_timeout_sec=hooks_total_timeout_sec,
+        hooks_max_parallel=hooks_max_parallel,
+    )
+
+
 class TestHookSystem:
     """Test HookSystem class."""
 
     @pytest.fixture
     def mock_config(self):
         """Create a mock config."""
-        config = MagicMock(spec=Config)
-        config.hooks_enabled = True
-        config.hooks = []
-        config.cwd = "/tmp"
-        return config
+        return fake_config()
 
     @pytest.fixture
     def hook_system(self, mock_config):
@@ -35,15 +71,15 @@ class TestHookSystem:
     def test_hook_system_with_disabled_hooks(self, mock_config):
         """Test HookSystem with hooks disabled."""
         mock_config.hooks_enabled = False
-        mock_config.hooks = [MagicMock(enabled=True)]
+        mock_config.hooks = [FakeHook(enabled=True)]
 
         system = HookSystem(mock_config)
         assert system.hooks == []
 
     def test_hook_system_filters_disabled_hooks(self, mock_config):
         """Test that HookSystem filters out disabled hooks."""
-        hook1 = MagicMock(enabled=True)
-        hook2 = MagicMock(enabled=False)
+        hook1 = FakeHook(enabled=True)
+        hook2 = FakeHook(enabled=False)
         hook1.trigger = HookTrigger.BEFORE_TOOL
         hook2.trigger = HookTrigger.BEFORE_TOOL
 
@@ -53,54 +89,59 @@ class TestHookSystem:
         assert len(system.hooks) == 1
         assert system.hooks[0].enabled is True
 
-    @pytest.mark.asyncio
+    def test_hooks_indexed_by_trigger(self, hook_system):
+        """Test that assigning hooks rebuilds the per-trigger index."""
+        before = FakeHook(trigger=HookTrigger.BEFORE_TOOL)
+        after = FakeHook(trigger=HookTrigger.AFTER_TOOL)
+
+        hook_system.hooks = [before, after]
+
+        assert hook_system._by_trigger[HookTrigger.BEFORE_TOOL] == [before]
+        assert hook_system._by_trigger[HookTrigger.AFTER_TOOL] == [after]
+        assert hook_system._by_trigger[HookTrigger.ON_ERROR] == []
+
     async def test_trigger_before_agent(self, hook_system):
         """Test triggering before_agent hooks."""
-        hook = MagicMock(enabled=True, trigger=HookTrigger.BEFORE_AGENT, script="echo 'test'", command=None, timeout_sec=5)
+        hook = FakeHook(enabled=True, trigger=HookTrigger.BEFORE_AGENT, script="echo 'test'", command=None, timeout_sec=5)
         hook_system.hooks = [hook]
 
         with patch.object(hook_system, '_run_hook', new_callable=AsyncMock):
             await hook_system.trigger_before_agent("test message")
 
-    @pytest.mark.asyncio
     async def test_trigger_after_agent(self, hook_system):
         """Test triggering after_agent hooks."""
-        hook = MagicMock(enabled=True, trigger=HookTrigger.AFTER_AGENT, script="echo 'test'", command=None, timeout_sec=5)
+        hook = FakeHook(enabled=True, trigger=HookTrigger.AFTER_AGENT, script="echo 'test'", command=None, timeout_sec=5)
         hook_system.hooks = [hook]
 
         with patch.object(hook_system, '_run_hook', new_callable=AsyncMock):
             await hook_system.trigger_after_agent("test message", "agent response")
 
-    @pytest.mark.asyncio
     async def test_trigger_before_tool(self, hook_system):
         """Test triggering before_tool hooks."""
-        hook = MagicMock(enabled=True, trigger=HookTrigger.BEFORE_TOOL, script="echo 'test'", command=None, timeout_sec=5)
+        hook = FakeHook(enabled=True, trigger=HookTrigger.BEFORE_TOOL, script="echo 'test'", command=None, timeout_sec=5)
         hook_system.hooks = [hook]
 
         with patch.object(hook_system, '_run_hook', new_callable=AsyncMock):
             await hook_system.trigger_before_tool("read_file", {"path": "/tmp/file.txt"})
 
-    @pytest.mark.asyncio
     async def test_trigger_after_tool(self, hook_system):
         """Test triggering after_tool hooks."""
-        hook = MagicMock(enabled=True, trigger=HookTrigger.AFTER_TOOL, script="echo 'test'", command=None, timeout_sec=5)
+        hook = FakeHook(enabled=True, trigger=HookTrigger.AFTER_TOOL, script="echo 'test'", command=None, timeout_sec=5)
         hook_system.hooks = [hook]
 
         result = ToolResult(success=True, output="file content", error=None)
         with patch.object(hook_system, '_run_hook', new_callable=AsyncMock):
             await hook_system.trigger_after_tool("read_file", {"path": "/tmp/file.txt"}, result)
 
-    @pytest.mark.asyncio
     async def test_trigger_on_error(self, hook_system):
         """Test triggering on_error hooks."""
-        hook = MagicMock(enabled=True, trigger=HookTrigger.ON_ERROR, script="echo 'error'", command=None, timeout_sec=5)
+        hook = FakeHook(enabled=True, trigger=HookTrigger.ON_ERROR, script="echo 'error'", command=None, timeout_sec=5)
         hook_system.hooks = [hook]
 
         error = Exception("Test error")
         with patch.object(hook_system, '_run_hook', new_callable=AsyncMock):
             await hook_system.trigger_on_error(error)
 
-    @pytest.mark.asyncio
     async def test_trigger_with_no_hooks(self, hook_system):
         """Test triggering with no hooks registered."""
         await hook_system.trigger_before_agent("test")
@@ -108,6 +149,17 @@ class TestHookSystem:
         await hook_system.trigger_before_tool("test", {})
         # Should not raise exception
 
+    async def test_trigger_with_no_hooks_skips_env(self, hook_system):
+        """Test that triggers without matching hooks never build an environment."""
+        with patch.object(hook_system, "_build_env") as build_env:
+            await hook_system.trigger_before_agent("test")
+            await hook_system.trigger_after_agent("test", "response")
+            await hook_system.trigger_before_tool("test", {})
+            await hook_system.trigger_after_tool("test", {}, ToolResult(success=True, output=""))
+            await hook_system.trigger_on_error(Exception("boom"))
+
+        build_env.assert_not_called()
+
     def test_hook_config_creation(self):
         """Test creating HookConfig objects."""
         # HookConfig is a Pydantic model, we just need to verify it can be created
@@ -142,15 +194,11 @@ class TestBuildEnv:
     @pytest.fixture
     def hook_system(self):
         """Create a HookSystem for testing."""
-        config = MagicMock(spec=Config)
-        config.hooks_enabled = True
-        config.hooks = []
-        config.cwd = "/test/path"
-        return HookSystem(config)
+        return HookSystem(fake_config(cwd="/test/path"))
 
     def test_build_env_basic(self, hook_system):
         """Test building basic environment."""
-        env = hook_system._build_env(HookTrigger.BEFORE_TOOL)
+        env = str_env(hook_system._build_env(HookTrigger.BEFORE_TOOL))
 
         assert "AI_AGENT_TRIGGER" in env
         assert env["AI_AGENT_TRIGGER"] == "before_tool"
@@ -159,35 +207,51 @@ class TestBuildEnv:
 
     def test_build_env_with_tool_name(self, hook_system):
         """Test building environment with tool name."""
-        env = hook_system._build_env(HookTrigger.BEFORE_TOOL, tool_name="read_file")
+        env = str_env(hook_system._build_env(HookTrigger.BEFORE_TOOL, tool_name="read_file"))
 
         assert env["AI_AGENT_TOOL_NAME"] == "read_file"
 
     def test_build_env_with_user_message(self, hook_system):
         """Test building environment with user message."""
-        env = hook_system._build_env(HookTrigger.BEFORE_AGENT, user_message="Hello")
+        env = str_env(hook_system._build_env(HookTrigger.BEFORE_AGENT, user_message="Hello"))
 
         assert env["AI_AGENT_USER_MESSAGE"] == "Hello"
 
     def test_build_env_with_error(self, hook_system):
         """Test building environment with error."""
         error = ValueError("Test error")
-        env = hook_system._build_env(HookTrigger.ON_ERROR, error=error)
+        env = str_env(hook_system._build_env(HookTrigger.ON_ERROR, error=error))
 
         assert env["AI_AGENT_ERROR"] == "Test error"
 
     def test_build_env_combined(self, hook_system):
         """Test building environment with multiple parameters."""
-        env = hook_system._build_env(
+        env = str_env(hook_system._build_env(
             HookTrigger.BEFORE_TOOL,
             tool_name="write_file",
             user_message="Write this file"
-        )
+        ))
 
         assert env["AI_AGENT_TRIGGER"] == "before_tool"
         assert env["AI_AGENT_TOOL_NAME"] == "write_file"
         assert env["AI_AGENT_USER_MESSAGE"] == "Write this file"
 
+    def test_build_env_with_tool_params_json(self, hook_system):
+        """Test that pre-serialized tool params are inserted verbatim."""
+        env = str_env(hook_system._build_env(
+            HookTrigger.BEFORE_TOOL, tool_params_json='{"path": "/tmp"}'
+        ))
+
+        assert env["AI_AGENT_TOOL_PARAMS"] == '{"path": "/tmp"}'
+
+    def test_build_env_does_not_mutate_base_env(self, hook_system):
+        """Test that per-call keys never leak into the cached parent environment."""
+        hook_system._build_env(HookTrigger.BEFORE_TOOL, tool_name="read_file")
+        env = str_env(hook_system._build_env(HookTrigger.ON_ERROR))
+
+        assert "AI_AGENT_TOOL_NAME" not in str_env(hook_system._base_env)
+        assert "AI_AGENT_TOOL_NAME" not in env
+
 
 class TestRunCommand:
     """Test command execution for hooks."""
@@ -195,31 +259,128 @@ class TestRunCommand:
     @pytest.fixture
     def hook_system(self):
         """Create a HookSystem for testing."""
-        config = MagicMock(spec=Config)
-        config.hooks_enabled = True
-        config.hooks = []
-        config.cwd = "/tmp"
-        return HookSystem(config)
+        return HookSystem(fake_config())
 
-    @pytest.mark.asyncio
     async def test_run_simple_command(self, hook_system):
         """Test running a simple command."""
         # Use echo command which should work everywhere
         await hook_system._run_command("echo test", timeout=5, env={})
 
-    @pytest.mark.asyncio
+    async def test_run_argv_command(self, hook_system):
+        """Test running an argv-list command without a shell."""
+        result = await hook_system._run_command(["echo", "test"], timeout=5, env={})
+
+        assert result.status == "ok"
+        assert result.returncode == 0
+
+    async def test_run_command_output_discarded_by_default(self, hook_system):
+        """Test that output is only collected when capture is requested."""
+        discarded = await hook_system._run_command(["echo", "test"], timeout=5, env={})
+        captured = await hook_system._run_command(
+            ["echo", "test"], timeout=5, env={}, capture=True
+        )
+
+        assert discarded.stdout == b""
+        assert captured.stdout == b"test\n"
+
+    async def test_run_command_receives_built_env(self, hook_system, tmp_path):
+        """Test that the env from _build_env reaches the subprocess intact."""
+        out = tmp_path / "out.txt"
+        env = hook_system._build_env(HookTrigger.BEFORE_TOOL, tool_name="read_file")
+
+        await hook_system._run_command(
+            f'printf %s "$AI_AGENT_TOOL_NAME" > {out}', timeout=5, env=env
+        )
+
+        assert out.read_text() == "read_file"
+
     async def test_run_command_timeout(self, hook_system):
         """Test command timeout handling."""
         # Sleep command should timeout - but _run_command catches TimeoutError internally
         # and handles it, so no exception should propagate
-        await hook_system._run_command("sleep 10", timeout=0.1, env={})
-        # If we get here, timeout was handled correctly
+        result = await hook_system._run_command("sleep 10", timeout=0.1, env={})
+
+        assert result.status == "timeout"
+        assert result.returncode is None
+
+    async def test_run_command_timeout_reaps_process(self, hook_system):
+        """Test that a timed-out command is killed and reaped."""
+        spawned = []
+        original = asyncio.create_subprocess_shell
+
+        async def spawn(*args, **kwargs):
+            process = await original(*args, **kwargs)
+            spawned.append(process)
+            return process
+
+        with patch("asyncio.create_subprocess_shell", spawn):
+            await hook_system._run_command("sleep 10", timeout=0.1, env={})
+
+        assert spawned[0].returncode is not None
+
+    async def test_run_command_cancel_reaps_process(self, hook_system):
+        """Test that cancelling a running command kills its process."""
+        spawned = []
+        original = asyncio.create_subprocess_shell
+
+        async def spawn(*args, **kwargs):
+            process = await original(*args, **kwargs)
+            spawned.append(process)
+            return process
+
+        with patch("asyncio.create_subprocess_shell", spawn):
+            task = asyncio.create_task(
+                hook_system._run_command("sleep 10", timeout=10, env={})
+            )
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert spawned[0].returncode is not None
+
+    async def test_concurrent_commands_capped_by_semaphore(self):
+        """Test that no more than hooks_max_parallel subprocesses run at once."""
+        hook_system = HookSystem(fake_config(hooks_max_parallel=8))
+        running = 0
+        peak = 0
+
+        class SlowProcess:
+            pid = 0
+            returncode = None
+
+            async def communicate(self):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                self.returncode = 0
+                return b"", b""
+
+        async def spawn(*args, **kwargs):
+            return SlowProcess()
+
+        with patch("asyncio.create_subprocess_shell", spawn):
+            await asyncio.gather(
+                *(hook_system._run_command("hook", timeout=5, env={}) for _ in range(32))
+            )
+
+        assert peak == 8
 
-    @pytest.mark.asyncio
     async def test_run_invalid_command(self, hook_system):
         """Test running invalid command."""
         # Invalid command should handle error gracefully
-        await hook_system._run_command("nonexistentcommand12345", timeout=1, env={})
+        result = await hook_system._run_command("nonexistentcommand12345", timeout=1, env={})
+
+        assert result.status == "nonzero"
+
+    async def test_run_missing_executable(self, hook_system):
+        """Test that a missing argv executable is reported, not raised."""
+        result = await hook_system._run_command(["/nonexistent/hook"], timeout=1, env={})
+
+        assert result.status == "spawn_error"
+        assert result.returncode is None
 
 
 class TestRunHook:
@@ -228,16 +389,11 @@ class TestRunHook:
     @pytest.fixture
     def hook_system(self):
         """Create a HookSystem for testing."""
-        config = MagicMock(spec=Config)
-        config.hooks_enabled = True
-        config.hooks = []
-        config.cwd = "/tmp"
-        return HookSystem(config)
+        return HookSystem(fake_config())
 
-    @pytest.mark.asyncio
     async def test_run_hook_with_script(self, hook_system):
         """Test running hook with script."""
-        hook = MagicMock(
+        hook = FakeHook(
             enabled=True,
             trigger=HookTrigger.BEFORE_TOOL,
             script="echo 'from script'",
@@ -247,10 +403,9 @@ class TestRunHook:
 
         await hook_system._run_hook(hook, {})
 
-    @pytest.mark.asyncio
     async def test_run_hook_with_command(self, hook_system):
         """Test running hook with command."""
-        hook = MagicMock(
+        hook = FakeHook(
             enabled=True,
             trigger=HookTrigger.BEFORE_TOOL,
             script=None,
@@ -260,10 +415,24 @@ class TestRunHook:
 
         await hook_system._run_hook(hook, {})
 
-    @pytest.mark.asyncio
+    async def test_run_hook_with_argv_command(self, hook_system):
+        """Test running hook with an argv-list command."""
+        hook = FakeHook(
+            enabled=True,
+            trigger=HookTrigger.BEFORE_TOOL,
+            script=None,
+            command=["echo", "from argv"],
+            timeout_sec=5
+        )
+
+        with patch.object(hook_system, "_run_command", new_callable=AsyncMock) as run:
+            await hook_system._run_hook(hook, {})
+
+        run.assert_awaited_once_with(["echo", "from argv"], 5, {}, False)
+
     async def test_run_hook_handles_exception(self, hook_system):
         """Test that hook exceptions are caught."""
-        hook = MagicMock(
+        hook = FakeHook(
             enabled=True,
             trigger=HookTrigger.BEFORE_TOOL,
             script="exit 1",
@@ -272,7 +441,21 @@ class TestRunHook:
         )
 
         # Should not raise exception
-        await hook_system._run_hook(hook, {})
+        result = await hook_system._run_hook(hook, {})
+
+        assert result.status == "nonzero"
+        assert result.returncode == 1
+
+    async def test_run_hook_logs_unexpected_errors(self, hook_system, caplog):
+        """Test that errors outside the subprocess are logged, not raised."""
+        hook = FakeHook(name="broken", command="true")
+
+        with patch.object(hook_system, "_run_command", side_effect=RuntimeError("boom")):
+            result = await hook_system._run_hook(hook, {})
+
+        assert result is None
+        assert "Hook broken failed" in caplog.text
+        assert "boom" in caplog.text
 
 
 class TestHookSystemIntegration:
@@ -281,12 +464,10 @@ class TestHookSystemIntegration:
     @pytest.fixture
     def config_with_hooks(self):
         """Create config with multiple hooks."""
-        config = MagicMock(spec=Config)
-        config.hooks_enabled = True
-        config.cwd = "/tmp"
+        config = fake_config()
 
         config.hooks = [
-            MagicMock(
+            FakeHook(
                 id="hook1",
                 enabled=True,
                 trigger=HookTrigger.BEFORE_TOOL,
@@ -294,7 +475,7 @@ class TestHookSystemIntegration:
                 command=None,
                 timeout_sec=5
             ),
-            MagicMock(
+            FakeHook(
                 id="hook2",
                 enabled=True,
                 trigger=HookTrigger.AFTER_TOOL,
@@ -302,7 +483,7 @@ class TestHookSystemIntegration:
                 command=None,
                 timeout_sec=5
             ),
-            MagicMock(
+            FakeHook(
                 id="hook3",
                 enabled=False,
                 trigger=HookTrigger.BEFORE_TOOL,
@@ -319,7 +500,6 @@ class TestHookSystemIntegration:
         # Should have 2 hooks (hook1 and hook2, hook3 is disabled)
         assert len(system.hooks) == 2
 
-    @pytest.mark.asyncio
     async def test_before_tool_triggers_correct_hooks(self, config_with_hooks):
         """Test that only BEFORE_TOOL hooks are triggered."""
         system = HookSystem(config_with_hooks)
@@ -339,7 +519,76 @@ class TestHookSystemIntegration:
         # Only after_tool hooks should be called
         assert len([h for h in called_hooks if h == "hook2"]) == 1
 
-    @pytest.mark.asyncio
+    async def test_hooks_for_same_trigger_run_concurrently(self, config_with_hooks):
+        """Test that hooks sharing a trigger are dispatched concurrently."""
+        system = HookSystem(config_with_hooks)
+        system.hooks = [
+            FakeHook(id=f"hook{i}", trigger=HookTrigger.BEFORE_TOOL) for i in range(3)
+        ]
+
+        active = 0
+        peak = 0
+
+        async def slow_run(hook, env):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        system._run_hook = slow_run
+
+        await system.trigger_before_tool("read_file", {})
+
+        assert peak == 3
+
+    async def test_total_timeout_cancels_running_hooks(self, config_with_hooks):
+        """Test that the per-trigger budget cancels hooks that overrun it."""
+        config_with_hooks.hooks_total_timeout_sec = 0.05
+        system = HookSystem(config_with_hooks)
+
+        cancelled = []
+
+        async def hang(hook, env):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(hook.id)
+                raise
+
+        system._run_hook = hang
+
+        await system.trigger_before_tool("read_file", {})
+
+        assert cancelled == ["hook1"]
+
+    async def test_run_hooks_returns_results(self, config_with_hooks):
+        """Test that _run_hooks collects each finished hook's result."""
+        system = HookSystem(config_with_hooks)
+        system.hooks = [
+            FakeHook(id="ok", trigger=HookTrigger.BEFORE_TOOL, command="true"),
+            FakeHook(id="fail", trigger=HookTrigger.BEFORE_TOOL, command="exit 3"),
+        ]
+
+        results = await system._run_hooks(HookTrigger.BEFORE_TOOL, {})
+
+        assert sorted((r.status, r.returncode) for r in results) == [
+            ("nonzero", 3),
+            ("ok", 0),
+        ]
+
+    async def test_run_hooks_omits_hooks_cut_off_by_budget(self, config_with_hooks):
+        """Test that hooks cancelled by the total budget have no result."""
+        config_with_hooks.hooks_total_timeout_sec = 0.05
+        system = HookSystem(config_with_hooks)
+
+        async def hang(hook, env):
+            await asyncio.sleep(10)
+
+        system._run_hook = hang
+
+        assert await system._run_hooks(HookTrigger.BEFORE_TOOL, {}) == []
+
     async def test_environment_variables_passed(self, config_with_hooks):
         """Test that environment variables are properly passed to hooks."""
         system = HookSystem(config_with_hooks)
@@ -347,7 +596,7 @@ class TestHookSystemIntegration:
         captured_env = []
 
         async def capture_env(hook, env):
-            captured_env.append(env)
+            captured_env.append(str_env(env))
 
         system._run_hook = capture_env
 
@@ -356,15 +605,14 @@ class TestHookSystemIntegration:
         assert len(captured_env) > 0
         assert "AI_AGENT_TOOL_NAME" in captured_env[0]
         assert captured_env[0]["AI_AGENT_TOOL_NAME"] == "read_file"
-        assert "AI_AGENT_TOOL_PARAMS" in captured_env[0]
+        assert json.loads(captured_env[0]["AI_AGENT_TOOL_PARAMS"]) == {"path": "/tmp/file.txt"}
 
-    @pytest.mark.asyncio
     async def test_after_agent_includes_response(self, config_with_hooks):
         """Test that after_agent hook includes response in environment."""
         system = HookSystem(config_with_hooks)
 
         # Need AFTER_AGENT hooks in the config
-        after_hook = MagicMock(
+        after_hook = FakeHook(
             id="after-hook",
             enabled=True,
             trigger=HookTrigger.AFTER_AGENT,
@@ -378,7 +626,7 @@ class TestHookSystemIntegration:
         captured_env = []
 
         async def capture_env(hook, env):
-            captured_env.append(env)
+            captured_env.append(str_env(env))
             # Don't actually run the command
             pass
 
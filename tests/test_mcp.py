@@ -115,6 +115,22 @@ class TestMCPServerManager:
         # Should include registry servers
         assert any(s["name"] == "filesystem" for s in servers)
 
+    def test_list_servers_reflects_custom_changes(self, manager):
+        """Test that the cached listing is refreshed on add and remove."""
+        before = len(manager.list_servers())
+
+        manager.add_custom_server(name="test-server", command="python", args=[])
+        assert len(manager.list_servers()) == before + 1
+
+        manager.remove_server("test-server")
+        assert len(manager.list_servers()) == before
+
+    def test_list_servers_returns_independent_copies(self, manager):
+        """Test that mutating a listing doesn't leak into the cache."""
+        manager.list_servers()[0]["name"] = "mutated"
+
+        assert manager.list_servers()[0]["name"] != "mutated"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
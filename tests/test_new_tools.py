@@ -1,389 +1,418 @@
-"""
-Comprehensive Test Suite for Friday New Tools
-Tests git, database, docker, and http_request tools.
+"""Tests for Friday's git, database, docker and http_request tools.
 
-To run: python tests/test_new_tools.py
+To run: pytest tests/test_new_tools.py
 """
 
 import asyncio
-import sys
-import os
-from pathlib import Path
-from datetime import datetime
+import json
+import re
+import shutil
+import sqlite3
+import subprocess
+import time
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+from werkzeug import Request, Response
 
 from friday_ai.config.config import Config
 from friday_ai.tools.base import ToolInvocation
-
-# Import new tools
 from friday_ai.tools.builtin.git import GitTool
 from friday_ai.tools.builtin.database import DatabaseTool
 from friday_ai.tools.builtin.docker import DockerTool
+from friday_ai.tools.builtin.http_client import get_http_client, shutdown_http_client
 from friday_ai.tools.builtin.http_request import HttpTool, HttpDownloadTool
 
 
-class NewToolsTester:
-    """Test runner for Friday's new tools"""
-
-    def __init__(self):
-        self.config = Config()
-        self.test_dir = Path(__file__).parent / "new_tools_workspace"
-        self.results = []
-
-    def setup(self):
-        """Create test workspace"""
-        self.test_dir.mkdir(exist_ok=True)
-
-        # Initialize a git repo for testing
-        import subprocess
-        subprocess.run(["git", "init"], cwd=self.test_dir, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=self.test_dir, capture_output=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=self.test_dir, capture_output=True)
-
-        # Create a sample file
-        (self.test_dir / "test.txt").write_text("Initial content\n")
-
-        print(f"✓ Created test workspace: {self.test_dir}")
-
-    def cleanup(self):
-        """Clean up test workspace"""
-        import shutil
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
-            print(f"✓ Cleaned up test workspace")
-
-    def log_result(self, tool_name: str, test_name: str, success: bool, message: str):
-        """Log test result"""
-        status = "✓ PASS" if success else "✗ FAIL"
-        self.results.append({
-            "tool": tool_name,
-            "test": test_name,
-            "success": success,
-            "message": message
-        })
-        print(f"  {status}: {test_name}")
-        if not success:
-            print(f"         → {message}")
-
-    async def test_git_tool(self):
-        """Test GitTool"""
-        print("\n🔧 Testing git tool...")
-        tool = GitTool(self.config)
-
-        # Test 1: git status
-        print("  Testing git status...")
-        invocation = ToolInvocation(params={"command": "status"}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("git", "git status",
-                       result.success and ("test.txt" in result.output or "Untracked" in result.output),
-                       result.output[:200] if result.success else result.error)
-
-        # Test 2: git log (should be empty initially)
-        invocation = ToolInvocation(params={"command": "log", "limit": 5}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("git", "git log (empty repo)",
-                       result.success,  # Should succeed even if empty
-                       result.output[:100] if result.success else result.error)
-
-        # Test 3: git add
-        invocation = ToolInvocation(params={"command": "add", "files": ["test.txt"]}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("git", "git add",
-                       result.success,
-                       result.output if result.success else result.error)
-
-        # Test 4: git commit
-        invocation = ToolInvocation(
-            params={"command": "commit", "message": "Initial commit"},
-            cwd=self.test_dir
-        )
-        result = await tool.execute(invocation)
-        self.log_result("git", "git commit",
-                       result.success,
-                       result.output if result.success else result.error)
-
-        # Test 5: git log after commit
-        invocation = ToolInvocation(params={"command": "log", "limit": 5}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("git", "git log (with commit)",
-                       result.success and "Initial commit" in result.output,
-                       result.output[:200] if result.success else result.error)
-
-        # Test 6: git diff
-        (self.test_dir / "test.txt").write_text("Modified content\n")
-        invocation = ToolInvocation(params={"command": "diff"}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("git", "git diff",
-                       result.success and ("Modified" in result.output or "content" in result.output),
-                       result.output[:200] if result.success else result.error)
-
-        # Test 7: git branch list
-        invocation = ToolInvocation(params={"command": "branch", "action": "list"}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("git", "git branch list",
-                       result.success,
-                       result.output[:200] if result.success else result.error)
-
-    async def test_database_tool(self):
-        """Test DatabaseTool"""
-        print("\n🗄️  Testing database tool...")
-        tool = DatabaseTool(self.config)
-
-        # Test 1: List tables (SQLite default)
-        print("  Testing database.tables (SQLite)...")
-        invocation = ToolInvocation(params={"action": "tables"}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("database", "List tables (SQLite)",
-                       result.success,  # Should succeed even if no tables
-                       result.output[:200] if result.success else result.error)
-
-        # Test 2: Create table via execute
-        invocation = ToolInvocation(
+@pytest.fixture(scope="session")
+def config():
+    """Create the config shared by every tool."""
+    return Config()
+
+
+def _init_repo(path):
+    """Initialise a git repository with one untracked file and no commits."""
+    # One git process; the identity is appended to .git/config directly
+    # rather than paying two more `git config` spawns.
+    subprocess.run(["git", "init", "--quiet"], cwd=path, capture_output=True, check=True)
+    with open(path / ".git" / "config", "a") as f:
+        f.write("[user]\n\tname = Test User\n\temail = test@example.com\n")
+
+    (path / "test.txt").write_text("Initial content\n")
+
+    return path
+
+
+@pytest.fixture(scope="session")
+def test_dir(tmp_path_factory):
+    """Create a git-initialised workspace for the whole run."""
+    # tmp_path_factory is per xdist worker and pytest prunes old runs itself.
+    return _init_repo(tmp_path_factory.mktemp("new_tools_ws"))
+
+
+@pytest.fixture
+def empty_repo(tmp_path):
+    """A fresh repository no other test writes to."""
+    return _init_repo(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def git_tool(config):
+    return GitTool(config)
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """Point DatabaseTool at a throwaway SQLite file for this test only."""
+    # DatabaseTool reconnects per call, so ":memory:" would drop the table
+    # between statements; use a file instead of database.db in the cwd.
+    for var in ("DATABASE_URL", "POSTGRES_URL", "MYSQL_URL", "SQLITE_PATH"):
+        monkeypatch.delenv(var, raising=False)
+    path = tmp_path / "test.db"
+    monkeypatch.setenv("SQLITE_DATABASE", str(path))
+    return path
+
+
+@pytest.fixture
+def database_tool(config, sqlite_db):
+    return DatabaseTool(config)
+
+
+@pytest.fixture(scope="session")
+def docker_available():
+    """Probe the docker daemon once so absent-docker runs skip immediately."""
+    if shutil.which("docker") is None:
+        return False
+    try:
+        probe = subprocess.run(["docker", "info"], capture_output=True, timeout=1.0)
+    except subprocess.TimeoutExpired:
+        return False
+    return probe.returncode == 0
+
+
+@pytest.fixture(scope="session")
+def docker_tool(config, docker_available):
+    if not docker_available:
+        pytest.skip("docker daemon not available")
+    return DockerTool(config)
+
+
+@pytest.fixture(scope="session")
+async def http_client():
+    """The pooled client HTTP tools share; closed once at the end of the run."""
+    yield await get_http_client()
+    await shutdown_http_client()
+
+
+@pytest.fixture(scope="session")
+def http_tool(config, http_client):
+    return HttpTool(config)
+
+
+@pytest.fixture(scope="session")
+def http_download_tool(config, http_client):
+    return HttpDownloadTool(config)
+
+
+def _json_response(payload: dict) -> Response:
+    return Response(json.dumps(payload), content_type="application/json")
+
+
+def _echo(request: Request) -> Response:
+    return _json_response(
+        {
+            "args": request.args.to_dict(),
+            "headers": dict(request.headers),
+            "json": request.get_json(silent=True),
+            "url": request.url,
+        }
+    )
+
+
+def _delay(request: Request) -> Response:
+    time.sleep(float(request.path.rsplit("/", 1)[-1]))
+    return _echo(request)
+
+
+@pytest.fixture
+def httpbin(httpserver):
+    """Serve the httpbin endpoints the HTTP tests use from localhost."""
+    httpserver.expect_request("/get").respond_with_handler(_echo)
+    httpserver.expect_request("/post", method="POST").respond_with_handler(_echo)
+    httpserver.expect_request("/headers").respond_with_handler(
+        lambda request: _json_response({"headers": dict(request.headers)})
+    )
+    httpserver.expect_request("/robots.txt").respond_with_data(
+        "User-agent: *\nDisallow: /deny\n", content_type="text/plain"
+    )
+    httpserver.expect_request(re.compile(r"^/delay/[\d.]+$")).respond_with_handler(_delay)
+    return httpserver.url_for("").rstrip("/")
+
+
+async def test_git_readonly(git_tool, empty_repo):
+    """Test status, log and branch list on the fresh repository."""
+    # Read-only commands don't depend on each other, so overlap their
+    # subprocess startup instead of awaiting them one by one.
+    status, log, branches = await asyncio.gather(
+        git_tool.execute(ToolInvocation(params={"command": "status"}, cwd=empty_repo)),
+        git_tool.execute(ToolInvocation(params={"command": "log", "limit": 5}, cwd=empty_repo)),
+        git_tool.execute(
+            ToolInvocation(params={"command": "branch", "action": "list"}, cwd=empty_repo)
+        ),
+    )
+
+    assert status.success, status.error
+    assert "test.txt" in status.output or "Untracked" in status.output
+    assert branches.success, branches.error
+    # git log exits non-zero until the first commit exists
+    assert not log.success
+    assert "does not have any commits" in log.error
+
+
+async def test_git_write_sequence(git_tool, test_dir):
+    """Test add -> commit -> log -> diff against the shared repository."""
+    result = await git_tool.execute(
+        ToolInvocation(params={"command": "add", "files": ["test.txt"]}, cwd=test_dir)
+    )
+    assert result.success, result.error
+
+    result = await git_tool.execute(
+        ToolInvocation(params={"command": "commit", "message": "Initial commit"}, cwd=test_dir)
+    )
+    assert result.success, result.error
+
+    result = await git_tool.execute(
+        ToolInvocation(params={"command": "log", "limit": 5}, cwd=test_dir)
+    )
+    assert result.success, result.error
+    assert "Initial commit" in result.output
+
+    (test_dir / "test.txt").write_text("Modified content\n")
+    result = await git_tool.execute(ToolInvocation(params={"command": "diff"}, cwd=test_dir))
+    assert result.success, result.error
+    assert "Modified" in result.output or "content" in result.output
+
+
+def _seed(path, rows=("Alice", "Bob")):
+    """Create the test table directly, so no test depends on another's writes."""
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.executemany("INSERT INTO test (name) VALUES (?)", [(name,) for name in rows])
+
+
+async def test_database_list_tables(database_tool, sqlite_db, test_dir):
+    """Test listing tables on the SQLite database."""
+    _seed(sqlite_db)
+
+    result = await database_tool.execute(ToolInvocation(params={"action": "tables"}, cwd=test_dir))
+
+    assert result.success, result.error
+    assert result.metadata["rows"] == [{"name": "test"}]
+
+
+async def test_database_create_table(database_tool, test_dir):
+    """Test CREATE TABLE through execute."""
+    result = await database_tool.execute(
+        ToolInvocation(
             params={
                 "action": "execute",
-                "query": "CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, name TEXT)"
+                "query": "CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, name TEXT)",
             },
-            cwd=self.test_dir
+            cwd=test_dir,
         )
-        result = await tool.execute(invocation)
-        self.log_result("database", "CREATE TABLE",
-                       result.success,
-                       result.output if result.success else result.error)
+    )
+
+    assert result.success, result.error
 
-        # Test 3: Insert data
-        invocation = ToolInvocation(
+
+async def test_database_insert(database_tool, sqlite_db, test_dir):
+    """Test inserting rows."""
+    _seed(sqlite_db, rows=())
+
+    result = await database_tool.execute(
+        ToolInvocation(
             params={
                 "action": "execute",
-                "query": "INSERT INTO test (name) VALUES ('Alice'), ('Bob')"
+                "query": "INSERT INTO test (name) VALUES ('Alice'), ('Bob')",
             },
-            cwd=self.test_dir
-        )
-        result = await tool.execute(invocation)
-        self.log_result("database", "INSERT data",
-                       result.success,
-                       result.output if result.success else result.error)
-
-        # Test 4: Query data
-        invocation = ToolInvocation(
-            params={"action": "query", "query": "SELECT * FROM test"},
-            cwd=self.test_dir
-        )
-        result = await tool.execute(invocation)
-        self.log_result("database", "SELECT query",
-                       result.success and ("Alice" in result.output or "Bob" in result.output or str(result.metadata)),
-                       result.output[:200] if result.success else result.error)
-
-        # Test 5: Get schema
-        invocation = ToolInvocation(
-            params={"action": "schema", "table": "test"},
-            cwd=self.test_dir
-        )
-        result = await tool.execute(invocation)
-        self.log_result("database", "Get table schema",
-                       result.success,
-                       result.output[:200] if result.success else result.error)
-
-    async def test_docker_tool(self):
-        """Test DockerTool"""
-        print("\n🐳 Testing docker tool...")
-        tool = DockerTool(self.config)
-
-        # Test 1: Docker ps (list containers)
-        print("  Testing docker ps...")
-        invocation = ToolInvocation(params={"command": "ps"}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-
-        # Should succeed even if Docker isn't running
-        # The tool will return an error if Docker isn't available
-        docker_available = result.success or "docker" not in result.error.lower() if result.error else True
-
-        self.log_result("docker", "docker ps",
-                       result.success or not docker_available,  # Pass if either success or docker not available
-                       result.output[:200] if result.success else result.error)
-
-        # Test 2: Docker images (list images)
-        invocation = ToolInvocation(params={"command": "images"}, cwd=self.test_dir)
-        result = await tool.execute(invocation)
-        self.log_result("docker", "docker images",
-                       result.success or not docker_available,
-                       result.output[:200] if result.success else result.error)
-
-        # Test 3: Docker inspect (will fail if no containers, that's ok)
-        invocation = ToolInvocation(
-            params={"command": "inspect", "container": "nonexistent"},
-            cwd=self.test_dir
-        )
-        result = await tool.execute(invocation)
-        # Expected to fail for nonexistent container
-        self.log_result("docker", "docker inspect (error handling)",
-                       not result.success,  # Should fail for nonexistent container
-                       result.error if result.error else result.output)
-
-    async def test_http_request_tool(self):
-        """Test HttpTool"""
-        print("\n🌐 Testing http_request tool...")
-        tool = HttpTool(self.config)
-
-        # Test 1: GET request to httpbin
-        print("  Testing GET request...")
-        invocation = ToolInvocation(
-            params={"method": "GET", "url": "https://httpbin.org/get"},
-            cwd=self.test_dir
+            cwd=test_dir,
         )
-        result = await tool.execute(invocation)
-        self.log_result("http_request", "GET request",
-                       result.success and "200" in result.output,
-                       result.output[:300] if result.success else result.error)
+    )
+
+    assert result.success, result.error
+    assert result.metadata["rowcount"] == 2
+
+
+async def test_database_select(database_tool, sqlite_db, test_dir):
+    """Test querying rows."""
+    _seed(sqlite_db)
+
+    result = await database_tool.execute(
+        ToolInvocation(params={"action": "query", "query": "SELECT * FROM test"}, cwd=test_dir)
+    )
+
+    assert result.success, result.error
+    assert [row["name"] for row in result.metadata["rows"]] == ["Alice", "Bob"]
+
+
+async def test_database_schema(database_tool, sqlite_db, test_dir):
+    """Test reading a table schema."""
+    _seed(sqlite_db)
+
+    result = await database_tool.execute(
+        ToolInvocation(params={"action": "schema", "table": "test"}, cwd=test_dir)
+    )
+
+    assert result.success, result.error
+    assert [column["name"] for column in result.metadata["rows"]] == ["id", "name"]
+
+
+@pytest.mark.network
+async def test_docker_ps(docker_tool, test_dir):
+    """Test listing containers."""
+    result = await docker_tool.execute(ToolInvocation(params={"command": "ps"}, cwd=test_dir))
+
+    assert result.success, result.error
+
+
+@pytest.mark.network
+async def test_docker_images(docker_tool, test_dir):
+    """Test listing images."""
+    result = await docker_tool.execute(ToolInvocation(params={"command": "images"}, cwd=test_dir))
+
+    assert result.success, result.error
+
+
+@pytest.mark.network
+async def test_docker_inspect_missing_container(docker_tool, test_dir):
+    """Test that inspecting a nonexistent container fails."""
+    result = await docker_tool.execute(
+        ToolInvocation(params={"command": "inspect", "container": "nonexistent"}, cwd=test_dir)
+    )
 
-        # Test 2: POST request with JSON
-        invocation = ToolInvocation(
+    assert not result.success
+
+
+async def test_http_get(http_tool, httpbin, test_dir):
+    """Test a plain GET request."""
+    result = await http_tool.execute(
+        ToolInvocation(params={"method": "GET", "url": f"{httpbin}/get"}, cwd=test_dir)
+    )
+
+    assert result.success, result.error
+    assert "200" in result.output
+
+
+async def test_http_post_json(http_tool, httpbin, test_dir):
+    """Test a POST request with a JSON body."""
+    result = await http_tool.execute(
+        ToolInvocation(
             params={
                 "method": "POST",
-                "url": "https://httpbin.org/post",
-                "json_data": {"test": "data", "number": 42}
+                "url": f"{httpbin}/post",
+                "json_data": {"test": "data", "number": 42},
             },
-            cwd=self.test_dir
+            cwd=test_dir,
         )
-        result = await tool.execute(invocation)
-        self.log_result("http_request", "POST JSON request",
-                       result.success and "200" in result.output,
-                       result.output[:300] if result.success else result.error)
+    )
+
+    assert result.success, result.error
+    assert "200" in result.output
 
-        # Test 3: Request with headers
-        invocation = ToolInvocation(
+
+async def test_http_custom_headers(http_tool, httpbin, test_dir):
+    """Test that custom headers are sent."""
+    result = await http_tool.execute(
+        ToolInvocation(
             params={
                 "method": "GET",
-                "url": "https://httpbin.org/headers",
-                "headers": {"X-Custom-Header": "test-value"}
+                "url": f"{httpbin}/headers",
+                "headers": {"X-Custom-Header": "test-value"},
             },
-            cwd=self.test_dir
+            cwd=test_dir,
         )
-        result = await tool.execute(invocation)
-        self.log_result("http_request", "Request with custom headers",
-                       result.success and "X-Custom-Header" in result.output,
-                       result.output[:300] if result.success else result.error)
+    )
+
+    assert result.success, result.error
+    assert "X-Custom-Header" in result.output
+
 
-        # Test 4: Request with query parameters
-        invocation = ToolInvocation(
+async def test_http_query_params(http_tool, httpbin, test_dir):
+    """Test that query parameters are sent."""
+    result = await http_tool.execute(
+        ToolInvocation(
             params={
                 "method": "GET",
-                "url": "https://httpbin.org/get",
-                "params": {"key1": "value1", "key2": "value2"}
+                "url": f"{httpbin}/get",
+                "params": {"key1": "value1", "key2": "value2"},
             },
-            cwd=self.test_dir
+            cwd=test_dir,
         )
-        result = await tool.execute(invocation)
-        self.log_result("http_request", "Request with query params",
-                       result.success and ("key1" in result.output or "value1" in result.output),
-                       result.output[:300] if result.success else result.error)
-
-    async def test_http_download_tool(self):
-        """Test HttpDownloadTool"""
-        print("\n📥 Testing http_download tool...")
-        tool = HttpDownloadTool(self.config)
-
-        # Test 1: Download a small file
-        print("  Testing file download...")
-        download_path = self.test_dir / "downloaded.txt"
-        invocation = ToolInvocation(
-            params={
-                "url": "https://httpbin.org/robots.txt",
-                "output_path": str(download_path)
-            },
-            cwd=self.test_dir
+    )
+
+    assert result.success, result.error
+    assert "key1" in result.output or "value1" in result.output
+
+
+async def test_http_concurrent_requests_share_client(http_tool, http_client, httpbin, test_dir):
+    """Test concurrent requests all go through the one pooled client."""
+    results = await asyncio.gather(
+        *(
+            http_tool.execute(
+                ToolInvocation(
+                    params={"method": "GET", "url": f"{httpbin}/get", "params": {"n": str(n)}},
+                    cwd=test_dir,
+                )
+            )
+            for n in range(4)
         )
-        result = await tool.execute(invocation)
-        file_exists = download_path.exists()
-        content = download_path.read_text() if file_exists else ""
+    )
+
+    assert all(result.success for result in results)
+    assert await get_http_client() is http_client
 
-        self.log_result("http_download", "Download file",
-                       result.success and file_exists and len(content) > 0,
-                       result.output if result.success else result.error)
 
-        # Test 2: Download with timeout
-        download_path2 = self.test_dir / "downloaded2.txt"
-        invocation = ToolInvocation(
+async def test_http_download(http_download_tool, httpbin, test_dir):
+    """Test downloading a small file."""
+    download_path = test_dir / "downloaded.txt"
+
+    result = await http_download_tool.execute(
+        ToolInvocation(
+            params={"url": f"{httpbin}/robots.txt", "output_path": str(download_path)},
+            cwd=test_dir,
+        )
+    )
+
+    assert result.success, result.error
+    assert download_path.exists()
+    # The tool reports bytes written, so there's no need to read the file back.
+    assert result.metadata["size"] > 0
+
+
+async def test_http_download_with_timeout(http_download_tool, httpbin, test_dir):
+    """Test downloading with an explicit timeout."""
+    download_path = test_dir / "downloaded2.txt"
+
+    result = await http_download_tool.execute(
+        ToolInvocation(
             params={
-                "url": "https://httpbin.org/delay/1",
-                "output_path": str(download_path2),
-                "timeout": 10
+                "url": f"{httpbin}/delay/0.1",
+                "output_path": str(download_path),
+                "timeout": 10,
             },
-            cwd=self.test_dir
+            cwd=test_dir,
         )
-        result = await tool.execute(invocation)
-        self.log_result("http_download", "Download with timeout",
-                       result.success,
-                       result.output if result.success else result.error)
-
-    async def run_all_tests(self):
-        """Run all new tool tests"""
-        print("=" * 60)
-        print("🚀 Friday New Tools Test Suite")
-        print(f"   Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   Model: {self.config.model_name}")
-        print("=" * 60)
-
-        self.setup()
-
-        try:
-            # Run all tests
-            await self.test_git_tool()
-            await self.test_database_tool()
-            await self.test_docker_tool()
-            await self.test_http_request_tool()
-            await self.test_http_download_tool()
-        finally:
-            self.cleanup()
-
-        # Print summary
-        print("\n" + "=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
-
-        passed = sum(1 for r in self.results if r["success"])
-        failed = sum(1 for r in self.results if not r["success"])
-        total = len(self.results)
-
-        # Group by tool
-        tools = {}
-        for r in self.results:
-            if r["tool"] not in tools:
-                tools[r["tool"]] = {"passed": 0, "failed": 0}
-            if r["success"]:
-                tools[r["tool"]]["passed"] += 1
-            else:
-                tools[r["tool"]]["failed"] += 1
-
-        print(f"\n{'Tool':<20} {'Passed':<10} {'Failed':<10} {'Status'}")
-        print("-" * 50)
-        for tool, counts in tools.items():
-            status = "✓" if counts["failed"] == 0 else "✗"
-            print(f"{tool:<20} {counts['passed']:<10} {counts['failed']:<10} {status}")
-
-        print("-" * 50)
-        print(f"{'TOTAL':<20} {passed:<10} {failed:<10}")
-        print(f"\nOverall: {passed}/{total} tests passed ({100*passed/total:.1f}%)")
-
-        if failed > 0:
-            print("\n❌ FAILED TESTS:")
-            for r in self.results:
-                if not r["success"]:
-                    print(f"  • {r['tool']}.{r['test']}: {r['message']}")
-        else:
-            print("\n✅ All tests passed!")
-
-        print("=" * 60)
-
-        return failed == 0
-
-
-async def main():
-    tester = NewToolsTester()
-    success = await tester.run_all_tests()
-    sys.exit(0 if success else 1)
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+    )
+
+    assert result.success, result.error
+
+
+@pytest.mark.network
+async def test_http_get_live_httpbin(http_tool, test_dir):
+    """Smoke-test a GET against the real httpbin.org."""
+    result = await http_tool.execute(
+        ToolInvocation(params={"method": "GET", "url": "https://httpbin.org/get"}, cwd=test_dir)
+    )
+
+    assert result.success, result.error
+    assert "200" in result.output
+
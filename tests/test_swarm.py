@@ -2,7 +2,7 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, patch
 
 from friday_ai.agent.swarm import (
     SwarmCoordinator,
@@ -14,6 +14,27 @@ from friday_ai.agent.swarm import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("eager_tasks")
+
+
+@pytest.fixture(scope="module")
+async def dependent_swarm():
+    """One two-task swarm run (tester depends on coder) shared by read-only tests."""
+    manager = AgentSwarmManager(max_parallel=2)
+    result = await manager.create_swarm_from_task(
+        description="Dependency test",
+        sub_tasks=[
+            {"description": "Base task", "role": "coder", "dependencies": []},
+            {
+                "description": "Dependent task",
+                "role": "tester",
+                "dependencies": ["swarm_task_0"],
+            },
+        ],
+    )
+    return manager, result
+
+
 class TestSwarmCoordinator:
     """Tests for SwarmCoordinator class."""
 
@@ -40,32 +61,15 @@ class TestSwarmCoordinator:
         assert "test-task-1" in coordinator.tasks
         assert coordinator.tasks["test-task-1"].description == "Test task"
 
-    @pytest.mark.asyncio
-    async def test_run_swarm_with_dependencies(self, coordinator):
+    def test_run_swarm_with_dependencies(self, dependent_swarm):
         """Test running swarm with task dependencies."""
-        # Create tasks with dependencies
-        task1 = Task(
-            id="task-1",
-            description="First task",
-            role=AgentRole.CODER,
-            dependencies=[],
-        )
-        task2 = Task(
-            id="task-2",
-            description="Second task depends on 1",
-            role=AgentRole.TESTER,
-            dependencies=["task-1"],
-        )
-
-        coordinator.add_task(task1)
-        coordinator.add_task(task2)
-
-        # Run swarm
-        results = await coordinator.run_swarm()
+        manager, _ = dependent_swarm
+        coordinator = manager.coordinator
 
-        assert len(results) == 2
-        assert "task-1" in results
-        assert "task-2" in results
+        assert len(coordinator.results) == 2
+        assert "swarm_task_0" in coordinator.results
+        assert "swarm_task_1" in coordinator.results
+        assert all(task.status == "completed" for task in coordinator.tasks.values())
 
     @pytest.mark.asyncio
     async def test_worker_processing(self, coordinator):
@@ -86,6 +90,47 @@ class TestSwarmCoordinator:
             assert mock_execute.called
             assert "worker-test" in results
 
+    @pytest.mark.asyncio
+    async def test_run_swarm_respects_max_agents(self, coordinator):
+        """Test that at most max_agents tasks execute at once, deps first."""
+        running = 0
+        peak = 0
+        order = []
+
+        async def execute(task):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            order.append(task.id)
+            return {"status": "done"}
+
+        for i in range(4):
+            coordinator.add_task(Task(id=f"t{i}", description="", role=AgentRole.CODER))
+        coordinator.add_task(
+            Task(id="last", description="", role=AgentRole.TESTER, dependencies=["t0", "t3"])
+        )
+
+        with patch.object(coordinator, "_execute_task", side_effect=execute):
+            results = await coordinator.run_swarm()
+
+        assert len(results) == 5
+        assert peak == 2
+        assert order[-1] == "last"
+
+    @pytest.mark.asyncio
+    async def test_run_swarm_skips_dependency_cycle(self, coordinator):
+        """Test that a dependency cycle is skipped instead of hanging the swarm."""
+        coordinator.add_task(Task(id="free", description="", role=AgentRole.CODER))
+        coordinator.add_task(Task(id="a", description="", role=AgentRole.CODER, dependencies=["b"]))
+        coordinator.add_task(Task(id="b", description="", role=AgentRole.CODER, dependencies=["a"]))
+
+        results = await asyncio.wait_for(coordinator.run_swarm(), timeout=1.0)
+
+        assert list(results) == ["free"]
+        assert coordinator.tasks["a"].status == "pending"
+
     @pytest.mark.asyncio
     async def test_execute_task_with_role(self, coordinator):
         """Test task execution with role delegation."""
@@ -123,7 +168,7 @@ class TestHierarchicalAgent:
         assert hierarchical.sub_agents[AgentRole.CODER] == mock_agent
 
     @pytest.mark.asyncio
-    async def test_execute_with_registered_agent(self, hierarchical):
+    async def test_execute_with_registered_agent(self, hierarchical, stub_agent):
         """Test execution with registered sub-agent."""
         task = Task(
             id="hier-test",
@@ -131,14 +176,14 @@ class TestHierarchicalAgent:
             role=AgentRole.CODER,
         )
 
-        mock_agent = AsyncMock()
-        mock_agent.execute.return_value = {"result": "success"}
-        hierarchical.register_sub_agent(AgentRole.CODER, mock_agent)
+        agent = stub_agent({"result": "success"})
+        hierarchical.register_sub_agent(AgentRole.CODER, agent)
 
         result = await hierarchical.execute(task)
 
         assert result["result"] == "success"
-        mock_agent.execute.assert_called_once_with(task)
+        assert len(agent.calls) == 1
+        assert agent.calls[0] is task
 
     @pytest.mark.asyncio
     async def test_execute_without_registered_agent(self, hierarchical):
@@ -260,6 +305,36 @@ class TestTaskDistributor:
 
         assert distributor.agents["agent-1"]["current_load"] == 2
 
+    @pytest.mark.asyncio
+    async def test_distribute_task_prefers_agent_after_completion(self, distributor):
+        """Test that completing tasks makes an agent the least-loaded choice again."""
+        for aid in ("agent-1", "agent-2", "agent-3"):
+            distributor.register_agent(agent_id=aid, roles=[AgentRole.CODER], capacity=2)
+
+        task = Task(id="heap-test", description="Heap test", role=AgentRole.CODER)
+        assigned = [await distributor.distribute_task(task) for _ in range(6)]
+
+        assert sorted(assigned) == ["agent-1", "agent-1", "agent-2", "agent-2", "agent-3", "agent-3"]
+        assert await distributor.distribute_task(task) is None
+
+        distributor.complete_task("agent-2")
+        assert await distributor.distribute_task(task) == "agent-2"
+
+    @pytest.mark.asyncio
+    async def test_heap_stays_bounded_over_many_cycles(self, distributor):
+        """Test that stale heap entries don't accumulate across distribute/complete."""
+        for aid in ("agent-1", "agent-2"):
+            distributor.register_agent(agent_id=aid, roles=[AgentRole.CODER], capacity=2)
+
+        task = Task(id="cycle-test", description="Cycle test", role=AgentRole.CODER)
+        for _ in range(2000):
+            agent_id = await distributor.distribute_task(task)
+            assert agent_id is not None
+            distributor.complete_task(agent_id)
+
+        assert len(distributor._heaps[AgentRole.CODER]) <= 2 * len(distributor.agents)
+        assert all(info["current_load"] == 0 for info in distributor.agents.values())
+
     def test_get_status(self, distributor):
         """Test getting distributor status."""
         distributor.register_agent(
@@ -291,47 +366,21 @@ class TestAgentSwarmManager:
         assert manager.hierarchical is not None
         assert manager.coordinator.max_agents == 2
 
-    @pytest.mark.asyncio
-    async def test_create_swarm_from_task(self, manager):
+    def test_create_swarm_from_task(self, dependent_swarm):
         """Test creating swarm from task."""
-        sub_tasks = [
-            {"description": "Task 1", "role": "coder"},
-            {"description": "Task 2", "role": "tester"},
-        ]
+        _, result = dependent_swarm
 
-        result = await manager.create_swarm_from_task(
-            description="Test swarm",
-            sub_tasks=sub_tasks,
-        )
-
-        assert result["description"] == "Test swarm"
+        assert result["description"] == "Dependency test"
         assert result["total_tasks"] == 2
         assert "results" in result
         assert len(result["results"]) == 2
 
-    @pytest.mark.asyncio
-    async def test_create_swarm_with_dependencies(self, manager):
+    def test_create_swarm_with_dependencies(self, dependent_swarm):
         """Test swarm with task dependencies."""
-        sub_tasks = [
-            {
-                "description": "Base task",
-                "role": "coder",
-                "dependencies": [],
-            },
-            {
-                "description": "Dependent task",
-                "role": "tester",
-                "dependencies": ["swarm_task_0"],
-            },
-        ]
+        _, result = dependent_swarm
 
-        result = await manager.create_swarm_from_task(
-            description="Dependency test",
-            sub_tasks=sub_tasks,
-        )
-
-        assert result["total_tasks"] == 2
-        assert len(result["results"]) == 2
+        assert result["results"]["swarm_task_1"]["role"] == "tester"
+        assert result["results"]["swarm_task_1"]["status"] == "completed"
 
     def test_setup_hierarchical_team(self, manager):
         """Test setting up hierarchical team."""
@@ -350,11 +399,10 @@ class TestAgentSwarmManager:
         assert AgentRole.TESTER in manager.hierarchical.sub_agents
 
     @pytest.mark.asyncio
-    async def test_execute_hierarchical(self, manager):
+    async def test_execute_hierarchical(self, manager, stub_agent):
         """Test hierarchical execution."""
-        mock_agent = AsyncMock()
-        mock_agent.execute.return_value = {"result": "hierarchical success"}
-        manager.hierarchical.register_sub_agent(AgentRole.CODER, mock_agent)
+        agent = stub_agent({"result": "hierarchical success"})
+        manager.hierarchical.register_sub_agent(AgentRole.CODER, agent)
 
         task = {
             "id": "hier-exec-test",
@@ -365,7 +413,8 @@ class TestAgentSwarmManager:
         result = await manager.execute_hierarchical(task)
 
         assert result["result"] == "hierarchical success"
-        mock_agent.execute.assert_called_once()
+        assert len(agent.calls) == 1
+        assert agent.calls[0].id == "hier-exec-test"
 
     def test_get_swarm_status(self, manager):
         """Test getting swarm status."""
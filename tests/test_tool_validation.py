@@ -50,17 +50,27 @@ class MockToolNoSchema(Tool):
         return ToolResult.success_result("success")
 
 
-def test_validate_tool_metadata_valid_tool():
-    """Test that a valid tool passes validation."""
-    tool = MockTool(config=Config())
+@pytest.fixture(scope="session")
+def config():
+    """Create the config shared by every tool in this module."""
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def mock_tool(config):
+    """Valid tool shared by the read-only validation tests."""
+    return MockTool(config=config)
 
+
+def test_validate_tool_metadata_valid_tool(mock_tool):
+    """Test that a valid tool passes validation."""
     # Should not raise any exception
-    validate_tool_metadata(tool)
+    validate_tool_metadata(mock_tool)
 
 
-def test_validate_tool_metadata_empty_description():
+def test_validate_tool_metadata_empty_description(config):
     """Test that tool with empty description fails validation."""
-    tool = MockToolInvalidDescription(config=Config())
+    tool = MockToolInvalidDescription(config=config)
 
     with pytest.raises(ToolValidationError) as exc_info:
         validate_tool_metadata(tool)
@@ -68,9 +78,9 @@ def test_validate_tool_metadata_empty_description():
     assert "description" in str(exc_info.value)
 
 
-def test_validate_tool_metadata_no_schema():
+def test_validate_tool_metadata_no_schema(config):
     """Test that tool without schema fails validation."""
-    tool = MockToolNoSchema(config=Config())
+    tool = MockToolNoSchema(config=config)
 
     with pytest.raises(ToolValidationError) as exc_info:
         validate_tool_metadata(tool)
@@ -78,17 +88,14 @@ def test_validate_tool_metadata_no_schema():
     assert "schema" in str(exc_info.value)
 
 
-def test_validate_tool_schema_valid_tool():
+def test_validate_tool_schema_valid_tool(mock_tool):
     """Test that a valid tool passes schema validation."""
-    tool = MockTool(config=Config())
-
     # Should not raise any exception
-    validate_tool_schema(tool)
+    validate_tool_schema(mock_tool)
 
 
-def test_tool_registry_rejects_invalid_tool():
+def test_tool_registry_rejects_invalid_tool(config):
     """Test that tool registry rejects tools that fail validation."""
-    config = Config()
     registry = ToolRegistry(config)
 
     # Try to register invalid tool
@@ -98,9 +105,8 @@ def test_tool_registry_rejects_invalid_tool():
         registry.register(invalid_tool)
 
 
-def test_tool_registry_accepts_valid_tool():
+def test_tool_registry_accepts_valid_tool(config):
     """Test that tool registry accepts valid tools."""
-    config = Config()
     registry = ToolRegistry(config)
 
     # Register valid tool
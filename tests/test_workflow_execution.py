@@ -10,55 +10,174 @@ Tests the real execution of workflow steps including:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import pytest
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
+from friday_ai.agent.events import AgentEvent
 from friday_ai.claude_integration.workflow_engine import (
     WorkflowEngine,
     WorkflowDefinition,
     WorkflowStep,
     WorkflowState,
 )
-from friday_ai.tools.base import ToolResult
+from friday_ai.tools.base import ToolInvocation, ToolResult
+from friday_ai.tools.builtin import ShellTool
 from friday_ai.tools.registry import ToolRegistry
-from friday_ai.config.config import Config
+from friday_ai.config.config import ShellEnvironmentPolicy
 
+pytestmark = pytest.mark.usefixtures("eager_tasks")
 
-@pytest.fixture
-def temp_workspace(tmp_path: Path) -> Path:
-    """Create a temporary workspace with .claude directory."""
-    claude_dir = tmp_path / ".claude"
+
+# Workflow files for the parsing tests, encoded once at import.
+_TEST_WORKFLOW_1_MD = b"""---
+name: Test Workflow 1
+description: First test workflow
+category: testing
+---
+
+## Step 1
+First step description
+"""
+_TEST_WORKFLOW_2_MD = b"""---
+name: Test Workflow 2
+description: Second test workflow
+category: audit
+---
+
+## Step 1
+Second workflow step
+"""
+_VALID_WORKFLOW_MD = b"""---
+name: Valid Workflow
+---
+
+## Step 1
+Valid step
+"""
+_NOT_A_WORKFLOW_MD = b"This is not markdown"
+_MY_WORKFLOW_MD = b"""---
+name: My Workflow
+---
+
+## Step 1
+Test step
+"""
+
+
+@contextmanager
+def swap_method(obj: object, name: str, fn):
+    """Temporarily replace ``obj.<name>`` with ``fn``, without mock machinery."""
+    shadowed = name in vars(obj)
+    original = getattr(obj, name)
+    setattr(obj, name, fn)
+    try:
+        yield fn
+    finally:
+        if shadowed:
+            setattr(obj, name, original)
+        else:
+            delattr(obj, name)
+
+
+async def _drain(events: AsyncIterator[AgentEvent]) -> list[AgentEvent]:
+    """Collect every event an async generator yields."""
+    return [event async for event in events]
+
+
+def make_state(workflow: WorkflowDefinition | None = None, **context) -> WorkflowState:
+    """Build a state the way execute_workflow does, with the definition under ``_workflow``."""
+    if workflow is not None:
+        context = {"_workflow": workflow, **context}
+    return WorkflowState(workflow_name=workflow.name if workflow else "test", context=context)
+
+
+def _make_workspace(root: Path) -> Path:
+    claude_dir = root / ".claude"
     claude_dir.mkdir()
     (claude_dir / "workflows").mkdir()
     return claude_dir
 
 
-@pytest.fixture
-def mock_config() -> Config:
-    """Create a mock config."""
-    config = MagicMock(spec=Config)
-    config.model_name = "test-model"
-    config.allowed_tools = None
-    return config
+@pytest.fixture(scope="session")
+def mock_config() -> SimpleNamespace:
+    """Create a stand-in config with just the attributes the tools read."""
+    return SimpleNamespace(
+        model_name="test-model",
+        allowed_tools=None,
+        shell_environment=ShellEnvironmentPolicy(),
+    )
 
 
-@pytest.fixture
-def tool_registry(mock_config: Config) -> ToolRegistry:
-    """Create a tool registry with mock tools."""
-    from friday_ai.tools.builtin import ShellTool
+class _EchoStubTool(ShellTool):
+    """Shell tool that answers like ``echo "test output"`` without spawning."""
 
-    registry = ToolRegistry(mock_config)
+    async def execute(self, invocation: ToolInvocation) -> ToolResult:
+        return ToolResult.success_result("test output\n")
 
-    # Create a real shell tool as a test tool
-    shell_tool = ShellTool(mock_config)
-    registry.register(shell_tool)
 
+def _registry_with(tool_cls: type[ShellTool], config: SimpleNamespace) -> ToolRegistry:
+    registry = ToolRegistry(config)
+    registry.register(tool_cls(config))
     return registry
 
 
+@pytest.fixture(scope="session")
+def stub_shell_registry(mock_config: SimpleNamespace) -> ToolRegistry:
+    """Registry whose shell tool is a no-spawn stub."""
+    return _registry_with(_EchoStubTool, mock_config)
+
+
+@pytest.fixture(scope="session")
+def real_shell_registry(mock_config: SimpleNamespace) -> ToolRegistry:
+    """Registry with the real ShellTool, for tests marked ``real_shell``."""
+    return _registry_with(ShellTool, mock_config)
+
+
 @pytest.fixture
-def sample_workflow(temp_workspace: Path) -> WorkflowDefinition:
+def tool_registry(request: pytest.FixtureRequest) -> ToolRegistry:
+    """Create a tool registry; the shell tool is stubbed unless marked ``real_shell``."""
+    if request.node.get_closest_marker("real_shell"):
+        return request.getfixturevalue("real_shell_registry")
+    return request.getfixturevalue("stub_shell_registry")
+
+
+@pytest.fixture(scope="session")
+def engine_factory():
+    """Return a factory that hands out one shared engine with fresh workflows."""
+    engine = WorkflowEngine(Path("/tmp/.claude"))
+
+    def factory(*workflows: WorkflowDefinition) -> WorkflowEngine:
+        engine._workflows = {workflow.name: workflow for workflow in workflows}
+        return engine
+
+    return factory
+
+
+@pytest.fixture
+def patched_invoke_agent(request: pytest.FixtureRequest, engine_factory, stub_agent):
+    """Yield the shared engine with ``_invoke_agent`` routed to a StubAgent.
+
+    Each call's arguments are recorded as one tuple in the agent's ``calls``.
+    Parametrize indirectly to choose the agent's result.
+    """
+    engine = engine_factory()
+    agent = stub_agent(getattr(request, "param", "Agent completed successfully"))
+
+    async def invoke(*args):
+        return await agent.execute(args)
+
+    with swap_method(engine, "_invoke_agent", invoke):
+        yield engine, agent
+
+
+@pytest.fixture(scope="session")
+def sample_workflow() -> WorkflowDefinition:
     """Create a sample workflow definition."""
     return WorkflowDefinition(
         name="test_workflow",
@@ -89,44 +208,35 @@ class TestWorkflowStepExecution:
 
     @pytest.mark.asyncio
     async def test_execute_step_with_agent(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self,
+        sample_workflow: WorkflowDefinition,
+        tool_registry: ToolRegistry,
+        patched_invoke_agent,
     ):
         """Test executing a step that invokes an agent."""
-        engine = WorkflowEngine(temp_workspace := Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
+        engine, agent = patched_invoke_agent
+        state = make_state(sample_workflow)
 
-        # Create state
-        state = WorkflowState(
-            workflow_name="test_workflow",
-            context={"_workflow": sample_workflow},
-        )
-
-        # Mock agent invocation
-        with patch.object(
-            engine,
-            "_invoke_agent",
-            new_callable=AsyncMock,
-            return_value="Agent completed successfully",
-        ) as mock_invoke:
-            step = sample_workflow.steps[0]  # Step with agent
-            result = await engine._execute_step(step, state, tool_registry)
+        step = sample_workflow.steps[0]  # Step with agent
+        result = await engine._execute_step(step, state, tool_registry)
 
-            # Verify agent was invoked (with 4 params including tool_registry)
-            mock_invoke.assert_called_once_with("planner", step.prompt, state, tool_registry)
-            assert "Agent completed successfully" in result
+        # Verify agent was invoked (with 4 params including tool_registry)
+        assert agent.calls == [("planner", step.prompt, state, tool_registry)]
+        assert "Agent completed successfully" in result
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("shell", ["stub", pytest.param("real", marks=pytest.mark.real_shell)])
     async def test_execute_step_with_tools(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self,
+        sample_workflow: WorkflowDefinition,
+        tool_registry: ToolRegistry,
+        engine_factory,
+        shell: str,
     ):
         """Test executing a step that invokes tools."""
-        engine = WorkflowEngine(temp_workspace := Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
+        engine = engine_factory(sample_workflow)
 
-        state = WorkflowState(
-            workflow_name="test_workflow",
-            context={"_workflow": sample_workflow},
-        )
+        state = make_state(sample_workflow)
 
         # Create a step that uses shell tool with echo
         step = WorkflowStep(
@@ -138,12 +248,14 @@ class TestWorkflowStepExecution:
         result = await engine._execute_step(step, state, tool_registry)
 
         # Verify tool was invoked and returned result
-        assert result is not None
-        assert len(result) > 0
+        assert "test output" in result
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "patched_invoke_agent", ["Agent completed with tool results"], indirect=True
+    )
     async def test_execute_step_with_both_agent_and_tools(
-        self, tool_registry: ToolRegistry
+        self, tool_registry: ToolRegistry, patched_invoke_agent
     ):
         """Test executing a step that has both agent and tools."""
         workflow = WorkflowDefinition(
@@ -158,39 +270,24 @@ class TestWorkflowStepExecution:
             ],
         )
 
-        engine = WorkflowEngine(Path("/tmp/.claude"))
-        engine._workflows = {"complex_workflow": workflow}
-
-        state = WorkflowState(
-            workflow_name="complex_workflow",
-            context={"_workflow": workflow},
-        )
+        engine, agent = patched_invoke_agent
+        state = make_state(workflow)
 
-        # Mock agent invocation
-        with patch.object(
-            engine,
-            "_invoke_agent",
-            new_callable=AsyncMock,
-            return_value="Agent completed with tool results",
-        ) as mock_invoke:
-            step = workflow.steps[0]
-            result = await engine._execute_step(step, state, tool_registry)
+        step = workflow.steps[0]
+        result = await engine._execute_step(step, state, tool_registry)
 
-            # Verify agent was invoked (tools execution handled in implementation)
-            mock_invoke.assert_called_once()
+        # Verify agent was invoked (tools execution handled in implementation)
+        assert len(agent.calls) == 1
+        assert result == "Agent completed with tool results"
 
     @pytest.mark.asyncio
     async def test_execute_step_with_missing_tool(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry, engine_factory
     ):
         """Test error handling when a specified tool is not found."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
+        engine = engine_factory(sample_workflow)
 
-        state = WorkflowState(
-            workflow_name="test_workflow",
-            context={"_workflow": sample_workflow},
-        )
+        state = make_state(sample_workflow)
 
         # Create step with non-existent tool
         step = WorkflowStep(
@@ -204,16 +301,12 @@ class TestWorkflowStepExecution:
 
     @pytest.mark.asyncio
     async def test_execute_step_with_no_agent_or_tools(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry, engine_factory
     ):
         """Test executing a step with no agent or tools (prompt only)."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
+        engine = engine_factory(sample_workflow)
 
-        state = WorkflowState(
-            workflow_name="test_workflow",
-            context={"_workflow": sample_workflow},
-        )
+        state = make_state(sample_workflow)
 
         step = sample_workflow.steps[2]  # Step with no agent or tools
         result = await engine._execute_step(step, state, tool_registry)
@@ -222,50 +315,41 @@ class TestWorkflowStepExecution:
         assert step.name in result or step.description in result
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "patched_invoke_agent", ['{"status": "completed", "value": 100}'], indirect=True
+    )
     async def test_execute_step_updates_context(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self,
+        sample_workflow: WorkflowDefinition,
+        tool_registry: ToolRegistry,
+        patched_invoke_agent,
     ):
         """Test that step execution updates state context."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
-
-        state = WorkflowState(
-            workflow_name="test_workflow",
-            context={"_workflow": sample_workflow, "initial_value": 42},
-        )
+        engine, _ = patched_invoke_agent
+        state = make_state(sample_workflow, initial_value=42)
 
-        # Mock agent invocation that returns context update
-        with patch.object(
-            engine,
-            "_invoke_agent",
-            new_callable=AsyncMock,
-            return_value='{"status": "completed", "value": 100}',
-        ):
-            step = sample_workflow.steps[0]
-            result = await engine._execute_step(step, state, tool_registry)
+        # Agent invocation returns a context update
+        step = sample_workflow.steps[0]
+        result = await engine._execute_step(step, state, tool_registry)
 
-            # Result should be available in context (stored by caller)
-            assert result is not None
+        # Result should be available in context (stored by caller)
+        assert result is not None
 
 
 class TestWorkflowAgentInvocation:
     """Tests for agent invocation within workflow steps."""
 
     @pytest.mark.asyncio
-    async def test_invoke_agent_with_valid_agent(self, tool_registry: ToolRegistry):
+    async def test_invoke_agent_with_valid_agent(
+        self, tool_registry: ToolRegistry, stub_agent, engine_factory
+    ):
         """Test invoking a valid agent."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={},
-        )
+        state = make_state()
 
-        # Mock subagent tool
-        mock_subagent = AsyncMock()
-        mock_subagent.execute = AsyncMock(
-            return_value=ToolResult.success_result("Agent execution completed")
-        )
+        # Stub subagent tool
+        mock_subagent = stub_agent(ToolResult.success_result("Agent execution completed"))
 
         with patch.object(
             engine,
@@ -279,14 +363,13 @@ class TestWorkflowAgentInvocation:
             assert "completed" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_invoke_agent_with_missing_agent(self, tool_registry: ToolRegistry):
+    async def test_invoke_agent_with_missing_agent(
+        self, tool_registry: ToolRegistry, engine_factory
+    ):
         """Test error handling when agent is not found."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={},
-        )
+        state = make_state()
 
         with patch.object(
             engine, "_get_subagent_tool", return_value=None
@@ -296,20 +379,16 @@ class TestWorkflowAgentInvocation:
             assert "not found" in result.lower() or "error" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_invoke_agent_propagates_context(self, tool_registry: ToolRegistry):
+    async def test_invoke_agent_propagates_context(
+        self, tool_registry: ToolRegistry, stub_agent, engine_factory
+    ):
         """Test that agent invocation receives workflow context."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={"project": "test_project", "feature": "auth"},
-        )
+        state = make_state(project="test_project", feature="auth")
 
-        # Mock subagent that receives context
-        mock_subagent = AsyncMock()
-        mock_subagent.execute = AsyncMock(
-            return_value=ToolResult.success_result("Done")
-        )
+        # Stub subagent that records the invocation it receives
+        mock_subagent = stub_agent(ToolResult.success_result("Done"))
 
         with patch.object(
             engine,
@@ -321,9 +400,9 @@ class TestWorkflowAgentInvocation:
             )
 
             # Verify context was available
-            mock_subagent.execute.assert_called_once()
-            call_args = mock_subagent.execute.call_args
-            assert call_args is not None
+            assert len(mock_subagent.calls) == 1
+            invocation = mock_subagent.calls[0]
+            assert "project: test_project" in invocation.params["goal"]
 
 
 class TestWorkflowExecution:
@@ -331,42 +410,33 @@ class TestWorkflowExecution:
 
     @pytest.mark.asyncio
     async def test_execute_workflow_with_all_steps(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry, engine_factory
     ):
         """Test executing a complete workflow with multiple steps."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
+        engine = engine_factory(sample_workflow)
 
-        events = []
-        async for event in engine.execute_workflow(
-            "test_workflow", tool_registry, initial_context={"test": "value"}
-        ):
-            events.append(event)
+        events = await _drain(
+            engine.execute_workflow(
+                "test_workflow", tool_registry, initial_context={"test": "value"}
+            )
+        )
 
         # Should have start, step events (start + complete for each), and complete
         assert len(events) >= 8  # start + (3 steps * 2) + complete
 
-        # Check workflow started
-        start_events = [e for e in events if e.data.get("name") == "workflow_start"]
-        assert len(start_events) == 1
-
-        # Check all steps executed (both start and complete events)
-        step_events = [e for e in events if e.data.get("name") == "workflow_step"]
-        assert len(step_events) == 6  # 3 steps * 2 events each
+        counts = Counter(e.data.get("name") for e in events)
 
-        # Check workflow completed
-        complete_events = [
-            e for e in events if e.data.get("name") == "workflow_complete"
-        ]
-        assert len(complete_events) == 1
+        # Workflow started once, every step started and completed, then finished
+        assert counts["workflow_start"] == 1
+        assert counts["workflow_step"] == 6  # 3 steps * 2 events each
+        assert counts["workflow_complete"] == 1
 
     @pytest.mark.asyncio
     async def test_execute_workflow_with_errors(
-        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry
+        self, sample_workflow: WorkflowDefinition, tool_registry: ToolRegistry, engine_factory
     ):
         """Test workflow execution with step errors."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
-        engine._workflows = {"test_workflow": sample_workflow}
+        engine = engine_factory(sample_workflow)
 
         # Mock step execution to fail on second step
         original_execute = engine._execute_step
@@ -376,23 +446,19 @@ class TestWorkflowExecution:
                 raise ValueError("Step execution failed")
             return await original_execute(step, state, registry)
 
-        with patch.object(engine, "_execute_step", side_effect=mock_execute):
-            events = []
-            async for event in engine.execute_workflow("test_workflow", tool_registry):
-                events.append(event)
+        with swap_method(engine, "_execute_step", mock_execute):
+            events = await _drain(engine.execute_workflow("test_workflow", tool_registry))
 
             # Should have error event
             error_events = [e for e in events if not e.data.get("success", True)]
             assert len(error_events) > 0
 
     @pytest.mark.asyncio
-    async def test_execute_workflow_nonexistent(self, tool_registry: ToolRegistry):
+    async def test_execute_workflow_nonexistent(self, tool_registry: ToolRegistry, engine_factory):
         """Test executing a workflow that doesn't exist."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        events = []
-        async for event in engine.execute_workflow("nonexistent_workflow", tool_registry):
-            events.append(event)
+        events = await _drain(engine.execute_workflow("nonexistent_workflow", tool_registry))
 
         # Should return error event
         assert len(events) == 1
@@ -402,8 +468,7 @@ class TestWorkflowExecution:
 class TestWorkflowContextManagement:
     """Tests for workflow context and state management."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_state_is_complete(self):
+    def test_workflow_state_is_complete(self):
         """Test WorkflowState.is_complete property."""
         workflow = WorkflowDefinition(
             name="test",
@@ -413,10 +478,7 @@ class TestWorkflowContextManagement:
             ],
         )
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={"_workflow": workflow},
-        )
+        state = make_state(workflow)
 
         # Initially not complete
         assert not state.is_complete
@@ -429,8 +491,29 @@ class TestWorkflowContextManagement:
         state.current_step_index = 2
         assert state.is_complete
 
-    @pytest.mark.asyncio
-    async def test_workflow_state_to_dict(self):
+    def test_workflow_definitions_are_frozen(self, sample_workflow: WorkflowDefinition):
+        """Test that shared workflow definitions can't be reassigned in place."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_workflow.steps[0].name = "Renamed"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_workflow.name = "renamed"
+
+    def test_workflow_definition_contents_are_read_only(self):
+        """Test that list and dict arguments are stored as immutable, hashable values."""
+        workflow = WorkflowDefinition(
+            name="frozen",
+            steps=[WorkflowStep(name="Step", tools=["shell"])],
+            prerequisites=["git"],
+            variables={"env": "test"},
+        )
+
+        assert workflow.steps[0].tools == ("shell",)
+        assert workflow.prerequisites == ("git",)
+        with pytest.raises(TypeError):
+            workflow.variables["env"] = "prod"
+        assert hash(workflow) == hash(dataclasses.replace(workflow, variables={}))
+
+    def test_workflow_state_to_dict(self):
         """Test WorkflowState.to_dict conversion."""
         workflow = WorkflowDefinition(
             name="test",
@@ -461,81 +544,50 @@ class TestWorkflowContextManagement:
 class TestWorkflowParsing:
     """Tests for workflow file parsing."""
 
-    @pytest.mark.asyncio
-    async def test_load_all_workflows(self, temp_workspace: Path):
+    # Written once for the class; each test asserts against its slice.
+    WORKFLOW_FILES = {
+        "test1.md": _TEST_WORKFLOW_1_MD,
+        "test2.md": _TEST_WORKFLOW_2_MD,
+        "valid.md": _VALID_WORKFLOW_MD,
+        "not_a_workflow.txt": _NOT_A_WORKFLOW_MD,
+        "my.md": _MY_WORKFLOW_MD,
+    }
+
+    @pytest.fixture(scope="class")
+    def loaded(
+        self, tmp_path_factory: pytest.TempPathFactory
+    ) -> tuple[WorkflowEngine, list[WorkflowDefinition]]:
+        """Populate one workspace and load it once for every parsing test."""
+        workspace = _make_workspace(tmp_path_factory.mktemp("parsing"))
+        for filename, content in self.WORKFLOW_FILES.items():
+            (workspace / "workflows" / filename).write_bytes(content)
+
+        engine = WorkflowEngine(workspace)
+        return engine, engine.load_all_workflows()
+
+    def test_load_all_workflows(self, loaded):
         """Test loading all workflows from directory."""
-        # Create sample workflow files
-        (temp_workspace / "workflows" / "test1.md").write_text(
-            """---
-name: Test Workflow 1
-description: First test workflow
-category: testing
----
+        _, workflows = loaded
 
-## Step 1
-First step description
-""",
-        )
-        (temp_workspace / "workflows" / "test2.md").write_text(
-            """---
-name: Test Workflow 2
-description: Second test workflow
-category: audit
----
+        assert len(workflows) == 4
+        assert {w.name for w in workflows} == {
+            "Test Workflow 1",
+            "Test Workflow 2",
+            "Valid Workflow",
+            "My Workflow",
+        }
 
-## Step 1
-Second workflow step
-""",
-        )
-
-        engine = WorkflowEngine(temp_workspace)
-        workflows = engine.load_all_workflows()
-
-        assert len(workflows) == 2
-        assert any(w.name == "Test Workflow 1" for w in workflows)
-        assert any(w.name == "Test Workflow 2" for w in workflows)
-
-    @pytest.mark.asyncio
-    async def test_load_workflows_with_invalid_file(self, temp_workspace: Path):
+    def test_load_workflows_with_invalid_file(self, loaded):
         """Test loading workflows with an invalid file."""
-        # Create valid workflow
-        (temp_workspace / "workflows" / "valid.md").write_text(
-            """---
-name: Valid Workflow
----
-
-## Step 1
-Valid step
-""",
-        )
+        _, workflows = loaded
 
-        # Create a file that's not a proper workflow
-        (temp_workspace / "workflows" / "not_a_workflow.txt").write_text(
-            "This is not markdown",
-        )
-
-        engine = WorkflowEngine(temp_workspace)
-        workflows = engine.load_all_workflows()
-
-        # Should load valid workflow (the .txt file won't match *.md glob)
-        assert len(workflows) == 1
-        assert workflows[0].name == "Valid Workflow"
+        # The .txt file won't match the *.md glob
+        assert all(w.name != "not_a_workflow" for w in workflows)
+        assert "Valid Workflow" in {w.name for w in workflows}
 
-    @pytest.mark.asyncio
-    async def test_get_workflow(self, temp_workspace: Path):
+    def test_get_workflow(self, loaded):
         """Test getting a specific workflow by name."""
-        (temp_workspace / "workflows" / "test.md").write_text(
-            """---
-name: My Workflow
----
-
-## Step 1
-Test step
-""",
-        )
-
-        engine = WorkflowEngine(temp_workspace)
-        engine.load_all_workflows()
+        engine, _ = loaded
 
         workflow = engine.get_workflow("My Workflow")
         assert workflow is not None
@@ -545,78 +597,34 @@ Test step
         missing = engine.get_workflow("Nonexistent")
         assert missing is None
 
-    @pytest.mark.asyncio
-    async def test_list_workflows(self, temp_workspace: Path):
+    def test_list_workflows(self, loaded):
         """Test listing all workflows."""
-        (temp_workspace / "workflows" / "test1.md").write_text(
-            """---
-name: Workflow 1
----
+        engine, workflows = loaded
 
-## Step 1
-""",
-        )
-        (temp_workspace / "workflows" / "test2.md").write_text(
-            """---
-name: Workflow 2
----
+        assert engine.list_workflows() == workflows
 
-## Step 1
-""",
-        )
-
-        engine = WorkflowEngine(temp_workspace)
-        engine.load_all_workflows()
-
-        all_workflows = engine.list_workflows()
-        assert len(all_workflows) == 2
-
-    @pytest.mark.asyncio
-    async def test_list_workflows_by_category(self, temp_workspace: Path):
+    def test_list_workflows_by_category(self, loaded):
         """Test filtering workflows by category."""
-        (temp_workspace / "workflows" / "test.md").write_text(
-            """---
-name: Test Workflow
-category: testing
----
-
-## Step 1
-""",
-        )
-        (temp_workspace / "workflows" / "audit.md").write_text(
-            """---
-name: Audit Workflow
-category: audit
----
-
-## Step 1
-""",
-        )
-
-        engine = WorkflowEngine(temp_workspace)
-        engine.load_all_workflows()
+        engine, _ = loaded
 
         testing_workflows = engine.list_workflows_by_category("testing")
         assert len(testing_workflows) == 1
-        assert testing_workflows[0].name == "Test Workflow"
+        assert testing_workflows[0].name == "Test Workflow 1"
 
         audit_workflows = engine.list_workflows_by_category("audit")
         assert len(audit_workflows) == 1
-        assert audit_workflows[0].name == "Audit Workflow"
+        assert audit_workflows[0].name == "Test Workflow 2"
 
 
 class TestWorkflowToolExecution:
     """Tests for _invoke_tool method."""
 
     @pytest.mark.asyncio
-    async def test_invoke_tool_with_missing_tool(self, tool_registry: ToolRegistry):
+    async def test_invoke_tool_with_missing_tool(self, tool_registry: ToolRegistry, engine_factory):
         """Test error handling when tool doesn't exist."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={},
-        )
+        state = make_state()
 
         result = await engine._invoke_tool(
             "nonexistent_tool", "Do something", state, tool_registry
@@ -625,14 +633,13 @@ class TestWorkflowToolExecution:
         assert "not found" in result.lower() or "error" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_invoke_tool_with_shell_command(self, tool_registry: ToolRegistry):
+    async def test_invoke_tool_with_shell_command(
+        self, tool_registry: ToolRegistry, engine_factory
+    ):
         """Test invoking shell tool with command parsing."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={},
-        )
+        state = make_state()
 
         # Mock shell tool to avoid actual execution
         with patch.object(
@@ -651,19 +658,15 @@ class TestWorkflowToolExecution:
 class TestWorkflowHelpers:
     """Tests for helper methods."""
 
-    @pytest.mark.asyncio
-    async def test_format_context(self):
+    def test_format_context(self, engine_factory):
         """Test _format_context method."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
-        state = WorkflowState(
-            workflow_name="test",
-            context={
-                "_workflow": "should be hidden",
-                "project": "my_project",
-                "feature": "auth",
-                "count": 42,
-            },
+        state = make_state(
+            _workflow="should be hidden",
+            project="my_project",
+            feature="auth",
+            count=42,
         )
 
         formatted = engine._format_context(state)
@@ -677,10 +680,9 @@ class TestWorkflowHelpers:
         # Should not contain internal keys
         assert "_workflow" not in formatted
 
-    @pytest.mark.asyncio
-    async def test_get_subagent_tool(self, tool_registry: ToolRegistry):
+    def test_get_subagent_tool(self, tool_registry: ToolRegistry, engine_factory):
         """Test _get_subagent_tool method."""
-        engine = WorkflowEngine(Path("/tmp/.claude"))
+        engine = engine_factory()
 
         # Try to get a tool that doesn't exist
         tool = engine._get_subagent_tool("nonexistent", tool_registry)